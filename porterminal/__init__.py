@@ -13,34 +13,27 @@ try:
 except ImportError:
     __version__ = "0.0.0-dev"  # Fallback before first build
 
+import asyncio
 import os
 import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
-from threading import Thread
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from porterminal.cli import display_startup_screen, parse_args
-from porterminal.infrastructure import (
-    CloudflaredInstaller,
-    drain_process_output,
-    find_available_port,
-    is_port_available,
-    start_cloudflared,
-    start_server,
-    wait_for_server,
-)
+    from rich.console import Console
 
-console = Console()
 
-
-def _run_in_background(args) -> int:
+def _run_in_background(args, console: "Console", notify_update: "Callable[[], None]") -> int:
     """Spawn the server in background and return immediately."""
     import tempfile
 
+    from porterminal.cli import display_startup_screen
+
     # Create temp file for URL communication
     url_file = Path(tempfile.gettempdir()) / f"porterminal-{os.getpid()}.url"
 
@@ -102,6 +95,7 @@ def _run_in_background(args) -> int:
                             else f"kill {proc.pid}"
                         )
                         console.print(f"[dim]Stop with: {stop_cmd}[/dim]\n")
+                        notify_update()
 
                         # Cleanup temp file
                         try:
@@ -142,12 +136,33 @@ def _run_in_background(args) -> int:
 
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    from porterminal.cli.args import parse_args
 
-    # Check for updates (notification only, never exec's)
-    from porterminal.updater import check_and_notify
+    args = parse_args()
 
-    check_and_notify()
+    # Heavy imports are deferred until here: parse_args() exits early for
+    # --version, --init, --update, etc., and importing the package (as the
+    # server process does via porterminal.app) should not pull them in.
+    from rich.console import Console
+
+    from porterminal.cli import display_startup_screen
+    from porterminal.infrastructure import (
+        CloudflaredInstaller,
+        find_available_port,
+        is_port_available,
+        start_cloudflared,
+        start_server,
+        tcp_probe,
+        wait_for_server,
+        watch_processes,
+    )
+
+    console = Console()
+
+    # Check for updates in the background (notification only, never exec's)
+    from porterminal.updater import start_update_check
+
+    notify_update = start_update_check()
     verbose = args.verbose
 
     # Load config to check require_password setting
@@ -176,7 +191,7 @@ def main() -> int:
 
     # Handle background mode
     if args.background:
-        return _run_in_background(args)
+        return _run_in_background(args, console, notify_update)
 
     # Set log level based on verbose flag
     if verbose:
@@ -216,8 +231,8 @@ def main() -> int:
 
     # Show startup status
     with console.status("[cyan]Starting...[/cyan]", spinner="dots") as status:
-        # Start or reuse server
-        if wait_for_server(check_host, port, timeout=1):
+        # Start or reuse server (only verify via /health if something is listening)
+        if tcp_probe(check_host, port) and wait_for_server(check_host, port, timeout=0.1):
             if verbose:
                 console.print(f"[dim]Reusing server on {bind_host}:{port}[/dim]")
             server_process = None
@@ -280,31 +295,23 @@ def main() -> int:
     else:
         # Display final screen (only in foreground mode)
         display_startup_screen(display_url, is_tunnel=not args.no_tunnel, cwd=display_cwd)
+        notify_update()
 
-    # Drain process output silently in background (only when not verbose)
-    if server_process is not None and not verbose:
-        Thread(target=drain_process_output, args=(server_process,), daemon=True).start()
-    if tunnel_process is not None:
-        Thread(target=drain_process_output, args=(tunnel_process,), daemon=True).start()
-
-    # Wait for Ctrl+C or process exit
+    # Drain process output silently (server only when not verbose) and
+    # wait for Ctrl+C or process exit
+    drained = [p for p in (None if verbose else server_process, tunnel_process) if p]
     try:
-        while True:
-            if server_process is not None and server_process.poll() is not None:
-                code = server_process.returncode
-                if code == 0 or code < 0:
-                    console.print("\n[dim]Server stopped[/dim]")
-                else:
-                    console.print(f"\n[yellow]Server stopped (exit code {code})[/yellow]")
-                break
-            if tunnel_process is not None and tunnel_process.poll() is not None:
-                code = tunnel_process.returncode
-                if code == 0 or code < 0:
-                    console.print("\n[dim]Tunnel closed[/dim]")
-                else:
-                    console.print(f"\n[yellow]Tunnel stopped (exit code {code})[/yellow]")
-                break
-            time.sleep(1)
+        exited = asyncio.run(watch_processes([server_process, tunnel_process], drain=drained))
+        code = exited.returncode
+        if exited is server_process:
+            if code == 0 or code < 0:
+                console.print("\n[dim]Server stopped[/dim]")
+            else:
+                console.print(f"\n[yellow]Server stopped (exit code {code})[/yellow]")
+        elif code == 0 or code < 0:
+            console.print("\n[dim]Tunnel closed[/dim]")
+        else:
+            console.print(f"\n[yellow]Tunnel stopped (exit code {code})[/yellow]")
 
     except KeyboardInterrupt:
         console.print("\n[dim]Shutting down...[/dim]")
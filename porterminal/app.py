@@ -2,10 +2,13 @@
 
 import asyncio
 import ctypes
+import json
 import logging
 import os
 import signal
+import sys
 from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI, Query, Request, Response, WebSocket, WebSocketDisconnect
@@ -26,15 +29,49 @@ logger = logging.getLogger(__name__)
 # Path to static files (inside package)
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Client hosts treated as local for privileged endpoints
+_LOCALHOSTS: frozenset[str] = frozenset({"127.0.0.1", "::1", "localhost"})
+
+# Headers that disable caching (always serve the latest frontend build)
+_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+@lru_cache(maxsize=256)
+def _session_info_frame(session_id: str, shell: str, tab_id: str, cols: int, rows: int) -> str:
+    """Encode the session_info message sent on every (re)connect.
+
+    Cached so reconnects to an unchanged session reuse the encoded frame;
+    a resize changes the key and produces a fresh one.
+    """
+    return json.dumps(
+        {
+            "type": "session_info",
+            "session_id": session_id,
+            "shell": shell,
+            "tab_id": tab_id,
+            "cols": cols,
+            "rows": rows,
+        }
+    )
 
-def is_admin() -> bool:
-    """Check if running as administrator (Windows)."""
+
+def _win_is_admin() -> bool:
+    """Check if running as administrator via the Windows shell API."""
     try:
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
         return False
 
 
+def is_admin() -> bool:
+    """Check if running as administrator (Windows only, always False elsewhere)."""
+    return sys.platform == "win32" and _win_is_admin()
+
+
 def security_preflight_checks() -> None:
     """Run security checks before starting the application."""
     # Check not running as admin
@@ -45,6 +82,17 @@ def security_preflight_checks() -> None:
         )
 
 
+def _build_client_config(container: Container) -> bytes:
+    """Serialize the client configuration (shells and buttons) to JSON."""
+    return json.dumps(
+        {
+            "shells": [{"id": s.id, "name": s.name} for s in container.available_shells],
+            "buttons": container.buttons,
+            "default_shell": container.default_shell_id,
+        }
+    ).encode("utf-8")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -52,6 +100,10 @@ async def lifespan(app: FastAPI):
     setup_logging_from_env()
     security_preflight_checks()
 
+    # Read the main page once; it only changes when the frontend is rebuilt
+    index_path = STATIC_DIR / "index.html"
+    app.state.index_html = index_path.read_text(encoding="utf-8") if index_path.is_file() else None
+
     # Create DI container with all wired dependencies
     # config_path=None uses find_config_file() to search standard locations
     cwd = os.environ.get("PORTERMINAL_CWD")
@@ -64,6 +116,9 @@ async def lifespan(app: FastAPI):
     container = create_container(config_path=None, cwd=cwd, password_hash=password_hash)
     app.state.container = container
 
+    # Config is fixed for the container's lifetime, so serialize it once
+    app.state.client_config_bytes = _build_client_config(container)
+
     # Wire up cascade: when session is destroyed, close associated tabs and broadcast
     async def on_session_destroyed(session_id, user_id):
         closed_tabs = container.tab_service.close_tabs_for_session(session_id)
@@ -100,29 +155,18 @@ def create_app() -> FastAPI:
         """Disable caching for static assets to ensure live updates during development."""
         response = await call_next(request)
         if request.url.path.startswith("/static/"):
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            response.headers.update(_NO_CACHE_HEADERS)
         return response
 
     # Mount static files
-    if STATIC_DIR.exists():
+    if STATIC_DIR.is_dir():
         app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
     @app.get("/", response_class=HTMLResponse)
     async def index():
         """Serve the main page."""
-        index_path = STATIC_DIR / "index.html"
-        if index_path.exists():
-            content = index_path.read_text(encoding="utf-8")
-            return HTMLResponse(
-                content=content,
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                },
-            )
+        if app.state.index_html is not None:
+            return HTMLResponse(content=app.state.index_html, headers=_NO_CACHE_HEADERS)
         return JSONResponse(
             {"error": "index.html not found"},
             status_code=404,
@@ -152,12 +196,7 @@ def create_app() -> FastAPI:
     @app.get("/api/config")
     async def get_client_config():
         """Get client configuration (shells and buttons)."""
-        container: Container = app.state.container
-        return {
-            "shells": [{"id": s.id, "name": s.name} for s in container.available_shells],
-            "buttons": container.buttons,
-            "default_shell": container.default_shell_id,
-        }
+        return Response(app.state.client_config_bytes, media_type="application/json")
 
     @app.post("/api/config/reload")
     async def reload_configuration():
@@ -181,7 +220,7 @@ def create_app() -> FastAPI:
         """
         # Check if request is from localhost
         client_host = request.client.host if request.client else None
-        is_localhost = client_host in ("127.0.0.1", "::1", "localhost")
+        is_localhost = client_host in _LOCALHOSTS
 
         # Check for Cloudflare Tunnel (has cf-ray header)
         is_cloudflare_tunnel = request.headers.get("cf-ray") is not None
@@ -340,7 +379,9 @@ def create_app() -> FastAPI:
 
         # Accept the connection
         await websocket.accept()
-        connection = FastAPIWebSocketAdapter(websocket)
+        connection = FastAPIWebSocketAdapter(
+            websocket, max_text_size=terminal_service.max_text_message_size
+        )
 
         logger.info(
             "WebSocket accepted client=%s user_id=%s tab_id=%s session_id=%s",
@@ -366,15 +407,14 @@ def create_app() -> FastAPI:
 
             # Send session info including current dimensions
             # New clients should adapt to existing dimensions to prevent rendering issues
-            await connection.send_message(
-                {
-                    "type": "session_info",
-                    "session_id": session.session_id,
-                    "shell": session.shell_id,
-                    "tab_id": tab.tab_id,
-                    "cols": session.dimensions.cols,
-                    "rows": session.dimensions.rows,
-                }
+            await connection.send_text(
+                _session_info_frame(
+                    session.session_id,
+                    session.shell_id,
+                    tab.tab_id,
+                    session.dimensions.cols,
+                    session.dimensions.rows,
+                )
             )
 
             # Handle terminal I/O
@@ -17,11 +17,16 @@ class ConnectionPort(Protocol):
         """Send JSON control message to client."""
         ...
 
-    async def receive(self) -> dict | bytes:
+    async def send_text(self, text: str) -> None:
+        """Send an already-encoded JSON control message to client."""
+        ...
+
+    async def receive(self) -> dict | list | bytes:
         """Receive message from client (binary or JSON).
 
         Returns:
-            bytes for terminal input, dict for control messages.
+            bytes for terminal input, dict for control messages, list for a
+            batch of control messages sent in one frame.
         """
         ...
 
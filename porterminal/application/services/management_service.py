@@ -6,6 +6,7 @@ from collections.abc import Callable
 from porterminal.application.ports import ConnectionPort, ConnectionRegistryPort
 from porterminal.application.services.session_service import SessionService
 from porterminal.application.services.tab_service import TabService
+from porterminal.application.services.terminal_service import PONG_FRAME
 from porterminal.domain import (
     ShellCommand,
     TerminalDimensions,
@@ -58,7 +59,7 @@ class ManagementService:
         elif msg_type == "rename_tab":
             await self._handle_rename_tab(user_id, connection, message)
         elif msg_type == "ping":
-            await connection.send_message({"type": "pong"})
+            await connection.send_text(PONG_FRAME)
         else:
             logger.warning("Unknown management message type: %s", msg_type)
 
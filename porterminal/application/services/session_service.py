@@ -3,9 +3,10 @@
 import asyncio
 import logging
 import os
+import time
 import uuid
+from collections import Counter
 from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
 
 from porterminal.domain import (
     EnvironmentRules,
@@ -14,6 +15,7 @@ from porterminal.domain import (
     Session,
     SessionId,
     SessionLimitChecker,
+    SessionLimitResult,
     ShellCommand,
     TerminalDimensions,
     UserId,
@@ -47,6 +49,7 @@ class SessionService:
         self._running = False
         self._cleanup_task: asyncio.Task | None = None
         self._on_session_destroyed: Callable[[SessionId, UserId], Awaitable[None]] | None = None
+        self._has_live_connections: Callable[[SessionId], bool] | None = None
 
     def set_on_session_destroyed(
         self, callback: Callable[[SessionId, UserId], Awaitable[None]]
@@ -57,6 +60,15 @@ class SessionService:
         """
         self._on_session_destroyed = callback
 
+    def set_connection_checker(self, checker: Callable[[SessionId], bool]) -> None:
+        """Set a check for whether a session has live terminal connections.
+
+        Used to pick sessions to evict. connected_clients also counts the
+        reference a tab holds on its session, so for tabs it never drops to
+        zero; without a checker, connected_clients is used as is.
+        """
+        self._has_live_connections = checker
+
     async def start(self) -> None:
         """Start the session service (cleanup loop)."""
         self._running = True
@@ -96,15 +108,16 @@ class SessionService:
         Returns:
             Created session.
 
+        If a limit is reached, the user's least recently used session without
+        live connections is destroyed (closing its shell) to make room.
+
         Raises:
-            ValueError: If session limits exceeded.
+            ValueError: If session limits exceeded and nothing could be evicted.
         """
         # Check limits
-        limit_result = self._limit_checker.can_create_session(
-            user_id,
-            self._repository.count_for_user(user_id),
-            self._repository.count(),
-        )
+        limit_result = self._check_create_limits(user_id)
+        if not limit_result.allowed and await self._evict_idle_session(user_id):
+            limit_result = self._check_create_limits(user_id)
         if not limit_result.allowed:
             raise ValueError(limit_result.reason)
 
@@ -113,7 +126,7 @@ class SessionService:
         pty = self._pty_factory(shell, dimensions, env, self._cwd)
 
         # Create session (starts with 0 clients, caller adds via add_client())
-        now = datetime.now(UTC)
+        now = time.monotonic()
         session = Session(
             id=SessionId(str(uuid.uuid4())),
             user_id=user_id,
@@ -134,6 +147,32 @@ class SessionService:
 
         return session
 
+    def _check_create_limits(self, user_id: UserId) -> SessionLimitResult:
+        """Check whether the user may create another session."""
+        return self._limit_checker.can_create_session(
+            user_id,
+            self._repository.count_for_user(user_id),
+            self._repository.count(),
+        )
+
+    async def _evict_idle_session(self, user_id: UserId) -> bool:
+        """Destroy the user's least recently used session with no live connections.
+
+        Returns:
+            True if a session was evicted.
+        """
+        has_live_connections = self._has_live_connections
+        for session in self._repository.get_by_user(user_id):
+            if has_live_connections is not None:
+                connected = has_live_connections(session.id)
+            else:
+                connected = session.is_connected
+            if not connected:
+                logger.info("Evicting idle session session_id=%s user_id=%s", session.id, user_id)
+                await self.destroy_session(session.id)
+                return True
+        return False
+
     async def reconnect_session(
         self,
         session_id: SessionId,
@@ -171,7 +210,8 @@ class SessionService:
             return None
 
         session.add_client()
-        session.touch(datetime.now(UTC))
+        session.touch(time.monotonic())
+        self._repository.mark_used(session_id)
         logger.info("Session reconnected session_id=%s user_id=%s", session_id, user_id)
 
         return session
@@ -181,7 +221,8 @@ class SessionService:
         session = self._repository.get(session_id)
         if session:
             remaining = session.remove_client()
-            session.touch(datetime.now(UTC))
+            session.touch(time.monotonic())
+            self._repository.mark_used(session_id)
             logger.info(
                 "Client disconnected session_id=%s remaining_clients=%d",
                 session_id,
@@ -230,8 +271,14 @@ class SessionService:
             await self._cleanup_stale_sessions()
 
     async def _cleanup_stale_sessions(self) -> None:
-        """Check and cleanup stale sessions."""
-        now = datetime.now(UTC)
+        """Check and cleanup stale sessions.
+
+        Candidates are collected first, then destroyed concurrently so one
+        slow teardown does not hold up the rest.
+        """
+        now = time.monotonic()
+        stale: list[SessionId] = []
+        reasons: Counter[str | None] = Counter()
 
         for session in self._repository.all_sessions():
             should_cleanup, reason = self._limit_checker.should_cleanup_session(
@@ -241,9 +288,26 @@ class SessionService:
             )
 
             if should_cleanup:
-                logger.info(
+                logger.debug(
                     "Cleaning up session session_id=%s reason=%s",
                     session.id,
                     reason,
                 )
-                await self.destroy_session(session.id)
+                stale.append(session.id)
+                reasons[reason] += 1
+
+        if not stale:
+            return
+
+        logger.info(
+            "Cleaning up %d stale sessions reasons=%s",
+            len(stale),
+            dict(reasons),
+        )
+        results = await asyncio.gather(
+            *(self.destroy_session(session_id) for session_id in stale),
+            return_exceptions=True,
+        )
+        for session_id, result in zip(stale, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Error cleaning up session session_id=%s: %s", session_id, result)
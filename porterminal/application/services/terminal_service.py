@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import re
+import time
 from contextlib import suppress
-from datetime import UTC, datetime
 from typing import Any
 
 from porterminal.domain import (
+    ESC_BYTE,
     PTYPort,
     RateLimitConfig,
     Session,
@@ -31,18 +32,30 @@ TERMINAL_RESPONSE_PATTERN = re.compile(rb"\x1b\[\?[\d;]*c|\x1b\[[\d;]*R")
 # Constants
 HEARTBEAT_INTERVAL = 30  # seconds
 HEARTBEAT_TIMEOUT = 300  # 5 minutes
-PTY_READ_INTERVAL = 0.008  # ~120Hz polling
+PTY_READ_INTERVAL = 0.008  # ~120Hz polling (when readiness can't be watched)
+PTY_IDLE_RECHECK_INTERVAL = 1.0  # Max wait for PTY readiness before re-checking liveness
+PTY_READ_CHUNK_SIZE = 65536  # Bytes per PTY read call
+PTY_READ_MAX_PER_TICK = 262144  # Cap on bytes drained per poll to bound latency
 OUTPUT_BATCH_INTERVAL = 0.016  # ~60Hz output (batch writes for smoother rendering)
 OUTPUT_BATCH_MAX_SIZE = 16384  # Flush if batch exceeds 16KB
-INTERACTIVE_THRESHOLD = 64  # Bytes - flush immediately for small interactive data
+INTERACTIVE_THRESHOLD = 64  # Bytes - small interactive data uses the short flush delay
+INTERACTIVE_FLUSH_DELAY = 0.002  # Coalesce keystroke echo bursts (e.g. paste) for 2ms
 MAX_INPUT_SIZE = 4096
 
+# Constant control frames, encoded once instead of per send
+_PING_FRAME = '{"type":"ping"}'
+PONG_FRAME = '{"type":"pong"}'  # Also the management connection's heartbeat reply
+_INPUT_TOO_LARGE_FRAME = '{"type":"error","message":"Input too large"}'
+_RATE_LIMITED_FRAME = '{"type":"error","message":"Rate limit exceeded"}'
 
-class AsyncioClock:
-    """Clock implementation using asyncio event loop time."""
 
-    def now(self) -> float:
-        return asyncio.get_running_loop().time()
+class MonotonicClock:
+    """Clock implementation using time.monotonic (no event loop lookup)."""
+
+    now = staticmethod(time.monotonic)
+
+
+_CLOCK = MonotonicClock()
 
 
 class TerminalService:
@@ -65,6 +78,19 @@ class TerminalService:
         self._session_read_tasks: dict[str, asyncio.Task[None]] = {}
         # Per-session locks to prevent race between buffer replay and broadcast
         self._session_locks: dict[str, asyncio.Lock] = {}
+        # Input accepted this event-loop turn, written to the PTY in one call
+        self._pending_input: dict[str, bytearray] = {}
+
+    @property
+    def max_text_message_size(self) -> int:
+        """Largest JSON text frame that can carry valid input.
+
+        Lets the transport reject bigger frames before parsing them. Input is
+        limited in code points, and with ASCII-only JSON (ensure_ascii) a code
+        point outside the BMP is escaped as a surrogate pair (\\ud83d\\ude00),
+        so each one takes up to 12 chars, plus room for the message envelope.
+        """
+        return self._max_input_size * 12 + 1024
 
     # -------------------------------------------------------------------------
     # Multi-client connection tracking
@@ -97,6 +123,38 @@ class TerminalService:
             del self._session_connections[session_id]
         return count
 
+    def has_connections(self, session_id: str) -> bool:
+        """Whether any client is currently connected to the session's terminal."""
+        return bool(self._session_connections.get(session_id))
+
+    # -------------------------------------------------------------------------
+    # PTY input
+    # -------------------------------------------------------------------------
+
+    def _queue_pty_write(self, session: Session[PTYPort], data: bytes) -> None:
+        """Queue input for the PTY, coalescing writes within one loop turn.
+
+        Frames that arrive back to back (fast typing, paste, several clients)
+        are appended to one buffer and written with a single PTY write.
+        """
+        session_id = str(session.id)
+        pending = self._pending_input.get(session_id)
+        if pending is not None:
+            pending += data
+            return
+        self._pending_input[session_id] = bytearray(data)
+        asyncio.get_running_loop().call_soon(self._flush_pty_input, session, session_id)
+
+    def _flush_pty_input(self, session: Session[PTYPort], session_id: str) -> None:
+        """Write all input queued for a session to its PTY."""
+        data = self._pending_input.pop(session_id, None)
+        if not data:
+            return
+        try:
+            session.pty_handle.write(bytes(data))
+        except Exception as e:
+            logger.warning("PTY write error session_id=%s: %s", session_id, e)
+
     async def _send_to_connections(self, connections: list[ConnectionPort], data: bytes) -> None:
         """Send data to a list of connections (used with pre-snapshotted list)."""
         for conn in connections:
@@ -151,8 +209,7 @@ class TerminalService:
             skip_buffer: Whether to skip sending buffered output.
         """
         session_id = str(session.id)
-        clock = AsyncioClock()
-        rate_limiter = TokenBucketRateLimiter(self._rate_limit_config, clock)
+        rate_limiter = TokenBucketRateLimiter(self._rate_limit_config, _CLOCK)
         lock = self._get_session_lock(session_id)
 
         # Register atomically to prevent race with broadcast.
@@ -188,15 +245,12 @@ class TerminalService:
             await connection.send_output(buffered)
 
         try:
-            # Start heartbeat for this connection
-            heartbeat_task = asyncio.create_task(self._heartbeat_loop(connection))
-
-            try:
+            # Heartbeat runs alongside the input loop; the task group cancels
+            # and awaits it however the input loop ends
+            async with asyncio.TaskGroup() as tg:
+                heartbeat_task = tg.create_task(self._heartbeat_loop(connection))
                 await self._handle_input_loop(session, connection, rate_limiter)
-            finally:
                 heartbeat_task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await heartbeat_task
 
         finally:
             # Unregister this connection
@@ -235,6 +289,46 @@ class TerminalService:
                 await task
         logger.debug("Stopped broadcast read loop session_id=%s", session_id)
 
+    @staticmethod
+    def _read_available(pty: PTYPort) -> bytes:
+        """Read everything the PTY has buffered, up to PTY_READ_MAX_PER_TICK bytes.
+
+        Coalescing reads means bulk output is handled (buffered, batched,
+        broadcast) once per poll instead of once per read call.
+        """
+        chunks: list[bytes] = []
+        total = 0
+        while total < PTY_READ_MAX_PER_TICK:
+            chunk = pty.read(PTY_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _wait_readable(fd: int, timeout: float | None) -> bool:
+        """Wait until fd is readable or timeout expires.
+
+        Returns:
+            True if fd became readable, False on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def on_readable() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        try:
+            done, _ = await asyncio.wait({ready}, timeout=timeout)
+            return bool(done)
+        finally:
+            loop.remove_reader(fd)
+
     async def _read_pty_broadcast_loop(
         self,
         session: Session[PTYPort],
@@ -245,10 +339,16 @@ class TerminalService:
         Single loop per session, regardless of client count.
 
         Batching strategy:
-        - Small data (<64 bytes): flush immediately for interactive responsiveness
+        - Small data (<64 bytes) starting a batch: flush after ~2ms, so echo
+          stays responsive but a burst of keystrokes (paste) becomes one message
         - Large data: batch for ~16ms to reduce WebSocket message frequency
         - Flush if batch exceeds 16KB to prevent memory buildup
 
+        Reads are event-driven when the PTY exposes a file descriptor: the loop
+        sleeps until output arrives (or a batch deadline is due) instead of
+        polling every 8ms. Otherwise (e.g. Windows) it falls back to polling,
+        sleeping only after a read comes back empty.
+
         Thread safety:
         - Uses session lock to prevent race between add_output/broadcast and
           new client registration/buffer replay. Lock is held briefly during
@@ -261,20 +361,17 @@ class TerminalService:
             return
 
         lock = self._get_session_lock(session_id)
-        batch_buffer: list[bytes] = []
-        batch_size = 0
-        last_flush_time = asyncio.get_running_loop().time()
+        woke_readable = False
+        batch_buffer = bytearray()  # Reused staging buffer for the pending batch
+        flush_deadline = 0.0  # Loop time by which the pending batch is flushed
 
         async def flush_batch() -> None:
             """Flush batched data with lock protection."""
-            nonlocal batch_buffer, batch_size, last_flush_time
             if not batch_buffer:
                 return
 
-            combined = b"".join(batch_buffer)
-            batch_buffer = []
-            batch_size = 0
-            last_flush_time = asyncio.get_running_loop().time()
+            combined = bytes(batch_buffer)
+            batch_buffer.clear()
 
             # Acquire lock, add to buffer, snapshot connections, release lock
             async with lock:
@@ -292,26 +389,53 @@ class TerminalService:
 
         while has_connections() and session.pty_handle.is_alive():
             try:
-                data = session.pty_handle.read(4096)
+                data = self._read_available(session.pty_handle)
                 if data:
-                    session.touch(datetime.now(UTC))
-
-                    # Small data (interactive): flush immediately for responsiveness
-                    if len(data) < INTERACTIVE_THRESHOLD and not batch_buffer:
-                        # Acquire lock, add to buffer, snapshot connections
-                        async with lock:
-                            session.add_output(data)
-                            connections = list(self._session_connections.get(session_id, set()))
-                        # Broadcast outside lock
-                        await self._send_to_connections(connections, data)
+                    session.touch(time.monotonic())
+
+                    # First data of a batch sets its deadline: short for small
+                    # interactive output, a full frame for bulk output
+                    if not batch_buffer:
+                        delay = (
+                            INTERACTIVE_FLUSH_DELAY
+                            if len(data) < INTERACTIVE_THRESHOLD
+                            else OUTPUT_BATCH_INTERVAL
+                        )
+                        flush_deadline = asyncio.get_running_loop().time() + delay
+                    batch_buffer += data
+
+                    # Flush if batch is large enough
+                    if len(batch_buffer) >= OUTPUT_BATCH_MAX_SIZE:
+                        await flush_batch()
+
+                # Check if we should flush based on time
+                current_time = asyncio.get_running_loop().time()
+                if batch_buffer and current_time >= flush_deadline:
+                    await flush_batch()
+
+                # Look the fd up on every pass: the PTY can be closed (e.g. its
+                # tab destroyed) while a flush is awaiting, and a stale fd
+                # number may already belong to another session's PTY
+                fd = session.pty_handle.fileno()
+                if fd is None and data:
+                    # Polling: more output is likely queued behind this read, so
+                    # just yield to other tasks and read again
+                    await asyncio.sleep(0)
+                elif fd is None or (woke_readable and not data):
+                    # No readiness support (or PTY closed), or a readable fd with
+                    # nothing to read (e.g. EOF on exit): poll instead of
+                    # spinning on the fd
+                    woke_readable = False
+                    delay = PTY_READ_INTERVAL
+                    if batch_buffer:
+                        delay = min(delay, max(0.0, flush_deadline - current_time))
+                    await asyncio.sleep(delay)
+                else:
+                    if batch_buffer:
+                        timeout = flush_deadline - current_time
                     else:
-                        # Batch larger data
-                        batch_buffer.append(data)
-                        batch_size += len(data)
-
-                        # Flush if batch is large enough
-                        if batch_size >= OUTPUT_BATCH_MAX_SIZE:
-                            await flush_batch()
+                        timeout = PTY_IDLE_RECHECK_INTERVAL
+                    woke_readable = await self._wait_readable(fd, max(0.0, timeout))
 
             except Exception as e:
                 logger.error("PTY read error session_id=%s: %s", session.id, e)
@@ -319,13 +443,6 @@ class TerminalService:
                 await self._broadcast_output(session_id, f"\r\n[PTY error: {e}]\r\n".encode())
                 break
 
-            # Check if we should flush based on time
-            current_time = asyncio.get_running_loop().time()
-            if batch_buffer and (current_time - last_flush_time) >= OUTPUT_BATCH_INTERVAL:
-                await flush_batch()
-
-            await asyncio.sleep(PTY_READ_INTERVAL)
-
         # Flush any remaining data
         await flush_batch()
 
@@ -338,7 +455,7 @@ class TerminalService:
         while connection.is_connected():
             await asyncio.sleep(HEARTBEAT_INTERVAL)
             try:
-                await connection.send_message({"type": "ping"})
+                await connection.send_text(_PING_FRAME)
             except Exception:
                 break
 
@@ -358,7 +475,13 @@ class TerminalService:
             if isinstance(message, bytes):
                 await self._handle_binary_input(session, message, rate_limiter, connection)
             elif isinstance(message, dict):
-                await self._handle_json_message(session, message, rate_limiter, connection)
+                if message.get("type") == "pong":
+                    # Heartbeat reply: only refreshes activity, skip dispatch
+                    session.touch(time.monotonic())
+                else:
+                    await self._handle_json_message(session, message, rate_limiter, connection)
+            elif isinstance(message, list):
+                await self._handle_json_batch(session, message, rate_limiter, connection)
 
     async def _handle_binary_input(
         self,
@@ -367,33 +490,31 @@ class TerminalService:
         rate_limiter: TokenBucketRateLimiter,
         connection: ConnectionPort,
     ) -> None:
-        """Handle binary terminal input."""
-        if len(data) > self._max_input_size:
-            await connection.send_message(
-                {
-                    "type": "error",
-                    "message": "Input too large",
-                }
-            )
+        """Handle binary terminal input.
+
+        Ordered for the common case (a small keystroke with no escape
+        sequence): one length check, one rate-limit call, then the write.
+        """
+        size = len(data)
+        if size > self._max_input_size:
+            await connection.send_text(_INPUT_TOO_LARGE_FRAME)
             return
 
         # Filter terminal response sequences before writing to PTY.
         # xterm.js generates these in response to DA/CPR queries.
         # If written back to PTY, they get echoed and displayed as garbage.
-        filtered = TERMINAL_RESPONSE_PATTERN.sub(b"", data)
-        if not filtered:
+        # Plain input has no ESC byte, so skip the regex entirely.
+        if ESC_BYTE in data:
+            data = TERMINAL_RESPONSE_PATTERN.sub(b"", data)
+            size = len(data)
+        if not size:
             return
 
-        if rate_limiter.try_acquire(len(filtered)):
-            session.pty_handle.write(filtered)
-            session.touch(datetime.now(UTC))
+        if rate_limiter.try_acquire(size):
+            self._queue_pty_write(session, data)
+            session.touch(time.monotonic())
         else:
-            await connection.send_message(
-                {
-                    "type": "error",
-                    "message": "Rate limit exceeded",
-                }
-            )
+            await connection.send_text(_RATE_LIMITED_FRAME)
             logger.warning("Rate limit exceeded session_id=%s", session.id)
 
     async def _handle_json_message(
@@ -403,21 +524,64 @@ class TerminalService:
         rate_limiter: TokenBucketRateLimiter,
         connection: ConnectionPort,
     ) -> None:
-        """Handle JSON control message."""
-        msg_type = message.get("type")
+        """Handle JSON control message.
 
-        if msg_type == "resize":
+        Branches are ordered by frequency: every client sends a heartbeat
+        ping on a timer, while keystrokes normally arrive as binary frames.
+        """
+        msg_type = message.get("type")
+        if msg_type != "input":
+            # Input is written at the end of the loop turn; write what is
+            # queued now so this message can't overtake input sent before it
+            self._flush_pty_input(session, str(session.id))
+
+        if msg_type == "ping":
+            await connection.send_text(PONG_FRAME)
+            session.touch(time.monotonic())
+        elif msg_type == "pong":
+            session.touch(time.monotonic())
+        elif msg_type == "resize":
             await self._handle_resize(session, message, connection)
         elif msg_type == "input":
             await self._handle_json_input(session, message, rate_limiter, connection)
-        elif msg_type == "ping":
-            await connection.send_message({"type": "pong"})
-            session.touch(datetime.now(UTC))
-        elif msg_type == "pong":
-            session.touch(datetime.now(UTC))
         else:
             logger.warning("Unknown message type session_id=%s type=%s", session.id, msg_type)
 
+    async def _handle_json_batch(
+        self,
+        session: Session[PTYPort],
+        messages: list[Any],
+        rate_limiter: TokenBucketRateLimiter,
+        connection: ConnectionPort,
+    ) -> None:
+        """Handle a JSON array of control messages sent in one frame.
+
+        Each input message is size-checked on its own, then consecutive
+        input is joined so the run takes a single rate-limit acquire and PTY
+        write. Messages are applied in order: a run of input is written
+        before the next control message (e.g. a resize) is dispatched.
+        """
+        parts: list[str] = []
+        for message in messages:
+            if not isinstance(message, dict):
+                continue
+            if message.get("type") == "input":
+                data = message.get("data")
+                if not isinstance(data, str):
+                    continue
+                if len(data) > self._max_input_size:
+                    await connection.send_text(_INPUT_TOO_LARGE_FRAME)
+                    continue
+                parts.append(data)
+                continue
+            if parts:
+                await self._write_json_input(session, "".join(parts), rate_limiter, connection)
+                parts.clear()
+            await self._handle_json_message(session, message, rate_limiter, connection)
+
+        if parts:
+            await self._write_json_input(session, "".join(parts), rate_limiter, connection)
+
     async def _handle_resize(
         self,
         session: Session[PTYPort],
@@ -432,18 +596,24 @@ class TerminalService:
         - New clients receive current dimensions and must adapt locally
         - This prevents rendering artifacts from dimension mismatches
         """
-        session_id = str(session.id)
-        cols = int(message.get("cols", 120))
-        rows = int(message.get("rows", 30))
+        cols = message.get("cols", 120)
+        rows = message.get("rows", 30)
+        # The client always sends integers; anything else is a protocol error
+        if type(cols) is not int or type(rows) is not int:
+            logger.warning("Invalid resize dimensions session_id=%s", session.id)
+            return
+        current = session.dimensions
 
+        # Skip if same as current (current dimensions are already in range,
+        # so this holds before clamping too)
+        if cols == current.cols and rows == current.rows:
+            return
         new_dims = TerminalDimensions.clamped(cols, rows)
-
-        # Skip if same as current
-        if session.dimensions == new_dims:
+        if new_dims == current:
             return
 
         # Check if multiple clients are connected
-        connections = self._session_connections.get(session_id, set())
+        connections = self._session_connections.get(str(session.id), ())
         if len(connections) > 1:
             # Multiple clients: reject resize, tell client to use current dimensions
             logger.info(
@@ -451,15 +621,15 @@ class TerminalService:
                 session.id,
                 new_dims.cols,
                 new_dims.rows,
-                session.dimensions.cols,
-                session.dimensions.rows,
+                current.cols,
+                current.rows,
             )
             # Send current dimensions back so client can adapt
             await connection.send_message(
                 {
                     "type": "resize_sync",
-                    "cols": session.dimensions.cols,
-                    "rows": session.dimensions.rows,
+                    "cols": current.cols,
+                    "rows": current.rows,
                 }
             )
             return
@@ -467,7 +637,7 @@ class TerminalService:
         # Single client: allow resize
         session.update_dimensions(new_dims)
         session.pty_handle.resize(new_dims)
-        session.touch(datetime.now(UTC))
+        session.touch(time.monotonic())
 
         logger.info(
             "Terminal resized session_id=%s cols=%d rows=%d",
@@ -487,28 +657,32 @@ class TerminalService:
         data = message.get("data", "")
 
         if len(data) > self._max_input_size:
-            await connection.send_message(
-                {
-                    "type": "error",
-                    "message": "Input too large",
-                }
-            )
+            await connection.send_text(_INPUT_TOO_LARGE_FRAME)
             return
 
-        if data:
-            input_bytes = data.encode("utf-8")
-            # Filter terminal response sequences
-            filtered = TERMINAL_RESPONSE_PATTERN.sub(b"", input_bytes)
-            if not filtered:
-                return
+        await self._write_json_input(session, data, rate_limiter, connection)
 
-            if rate_limiter.try_acquire(len(filtered)):
-                session.pty_handle.write(filtered)
-                session.touch(datetime.now(UTC))
-            else:
-                await connection.send_message(
-                    {
-                        "type": "error",
-                        "message": "Rate limit exceeded",
-                    }
-                )
+    async def _write_json_input(
+        self,
+        session: Session[PTYPort],
+        data: str,
+        rate_limiter: TokenBucketRateLimiter,
+        connection: ConnectionPort,
+    ) -> None:
+        """Filter, rate-limit and queue JSON input already checked for size."""
+        if not data:
+            return
+
+        # Encode once; filter terminal response sequences only if an ESC is present
+        input_bytes = data.encode()
+        if "\x1b" in data:
+            input_bytes = TERMINAL_RESPONSE_PATTERN.sub(b"", input_bytes)
+        size = len(input_bytes)
+        if not size:
+            return
+
+        if rate_limiter.try_acquire(size):
+            self._queue_pty_write(session, input_bytes)
+            session.touch(time.monotonic())
+        else:
+            await connection.send_text(_RATE_LIMITED_FRAME)
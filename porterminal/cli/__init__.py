@@ -1,13 +1,17 @@
 """CLI utilities for Porterminal."""
 
+from typing import TYPE_CHECKING, Any
+
 from .args import parse_args
-from .display import (
-    LOGO,
-    TAGLINE,
-    display_startup_screen,
-    get_caution,
-    get_qr_code,
-)
+
+if TYPE_CHECKING:
+    from .display import (
+        LOGO,
+        TAGLINE,
+        display_startup_screen,
+        get_caution,
+        get_qr_code,
+    )
 
 __all__ = [
     "parse_args",
@@ -17,3 +21,17 @@ __all__ = [
     "LOGO",
     "TAGLINE",
 ]
+
+# Display helpers pull in rich and qrcode; import them on first access so
+# parsing arguments (--version, --init, ...) stays cheap.
+_DISPLAY_NAMES = frozenset(
+    {"LOGO", "TAGLINE", "display_startup_screen", "get_caution", "get_qr_code"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DISPLAY_NAMES:
+        from . import display
+
+        return getattr(display, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -140,6 +140,8 @@ buttons:
 #   rows: 30
 """
 
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG.encode("utf-8")
+
 
 def _init_config() -> None:
     """Create .ptn/ptn.yaml in current directory."""
@@ -153,7 +155,7 @@ def _init_config() -> None:
         return
 
     config_dir.mkdir(exist_ok=True)
-    config_file.write_text(DEFAULT_CONFIG)
+    config_file.write_bytes(_DEFAULT_CONFIG_BYTES)
     print(f"Created: {config_file}")
 
 
@@ -104,6 +104,9 @@ class PTYManagerAdapter:
     def close(self) -> None:
         self._manager.close()
 
+    def fileno(self) -> int | None:
+        return self._manager.fileno()
+
     @property
     def dimensions(self) -> TerminalDimensions:
         return self._dimensions
@@ -184,6 +187,11 @@ def create_container(
 
     terminal_service = TerminalService()
 
+    # Evict only sessions no terminal client is attached to
+    session_service.set_connection_checker(
+        lambda session_id: terminal_service.has_connections(str(session_id))
+    )
+
     # Create a shell provider closure for ManagementService
     def get_shell(shell_id: str | None) -> ShellCommand | None:
         target_id = shell_id or default_shell_id
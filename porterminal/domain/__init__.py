@@ -4,6 +4,7 @@
 # Entities
 from .entities import (
     CLEAR_SCREEN_SEQUENCE,
+    ESC_BYTE,
     MAX_SESSIONS_PER_USER,
     MAX_TABS_PER_USER,
     MAX_TOTAL_SESSIONS,
@@ -70,6 +71,7 @@ __all__ = [
     "OutputBuffer",
     "OUTPUT_BUFFER_MAX_BYTES",
     "CLEAR_SCREEN_SEQUENCE",
+    "ESC_BYTE",
     "Tab",
     "MAX_TABS_PER_USER",
     # Services
@@ -1,6 +1,11 @@
 """Domain entities - objects with identity and lifecycle."""
 
-from .output_buffer import CLEAR_SCREEN_SEQUENCE, OUTPUT_BUFFER_MAX_BYTES, OutputBuffer
+from .output_buffer import (
+    CLEAR_SCREEN_SEQUENCE,
+    ESC_BYTE,
+    OUTPUT_BUFFER_MAX_BYTES,
+    OutputBuffer,
+)
 from .session import MAX_SESSIONS_PER_USER, MAX_TOTAL_SESSIONS, Session
 from .tab import MAX_TABS_PER_USER, Tab
 
@@ -11,6 +16,7 @@ __all__ = [
     "OutputBuffer",
     "OUTPUT_BUFFER_MAX_BYTES",
     "CLEAR_SCREEN_SEQUENCE",
+    "ESC_BYTE",
     "Tab",
     "MAX_TABS_PER_USER",
 ]
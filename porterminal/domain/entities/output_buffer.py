@@ -1,6 +1,5 @@
 """Output buffer entity for session reconnection."""
 
-from collections import deque
 from dataclasses import dataclass, field
 
 # Business rules
@@ -9,28 +8,35 @@ OUTPUT_BUFFER_MAX_BYTES = 1_000_000  # 1MB
 # Terminal escape sequence for clear screen (ED2)
 CLEAR_SCREEN_SEQUENCE = b"\x1b[2J"
 
+# First byte of every escape sequence; most terminal data contains none
+ESC_BYTE = 0x1B
 
-@dataclass
+
+@dataclass(slots=True)
 class OutputBuffer:
     """Output buffer for session reconnection.
 
     Pure domain logic for buffering terminal output.
     No async, no WebSocket - just data management.
+
+    Output is kept in a single bytearray holding the most recent max_bytes.
+    Trimming deletes from the front, which CPython's bytearray does without
+    moving the remaining data, so it behaves like a ring buffer that only
+    allocates as much as it holds.
     """
 
     max_bytes: int = OUTPUT_BUFFER_MAX_BYTES
-    _buffer: deque[bytes] = field(default_factory=deque)
-    _size: int = 0
+    _buffer: bytearray = field(default_factory=bytearray)
 
     @property
     def size(self) -> int:
         """Current buffer size in bytes."""
-        return self._size
+        return len(self._buffer)
 
     @property
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
-        return self._size == 0
+        return not self._buffer
 
     def add(self, data: bytes) -> None:
         """Add data to the buffer.
@@ -38,32 +44,25 @@ class OutputBuffer:
         Handles clear screen detection and size limits.
         When clear screen is detected, only keep content AFTER the last clear sequence.
         """
-        # Check for clear screen sequence
-        if CLEAR_SCREEN_SEQUENCE in data:
-            # Clear old buffer
-            self.clear()
+        # Check for clear screen sequence (skip the substring search for plain text)
+        if ESC_BYTE in data:
             # Find the LAST occurrence of clear screen and only keep content after it
             last_clear_pos = data.rfind(CLEAR_SCREEN_SEQUENCE)
-            data_after_clear = data[last_clear_pos + len(CLEAR_SCREEN_SEQUENCE) :]
-            # Only add if there's meaningful content after clear
-            if data_after_clear:
-                self._buffer.append(data_after_clear)
-                self._size += len(data_after_clear)
-            return
+            if last_clear_pos != -1:
+                self.clear()
+                data = memoryview(data)[last_clear_pos + len(CLEAR_SCREEN_SEQUENCE) :]
 
-        self._buffer.append(data)
-        self._size += len(data)
+        self._buffer += data
 
-        # Trim if over limit
-        while self._size > self.max_bytes and self._buffer:
-            removed = self._buffer.popleft()
-            self._size -= len(removed)
+        # Trim oldest bytes if over limit
+        overflow = len(self._buffer) - self.max_bytes
+        if overflow > 0:
+            del self._buffer[:overflow]
 
     def get_all(self) -> bytes:
         """Get all buffered output as single bytes object."""
-        return b"".join(self._buffer)
+        return bytes(self._buffer)
 
     def clear(self) -> None:
         """Clear the buffer."""
         self._buffer.clear()
-        self._size = 0
@@ -1,7 +1,6 @@
 """Session entity - pure domain representation."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import TypeVar
 
 from ..values.session_id import SessionId
@@ -19,21 +18,24 @@ RECONNECT_WINDOW_SECONDS = 0  # 0 = unlimited
 SESSION_MAX_DURATION_SECONDS = 0  # 0 = unlimited
 
 
-@dataclass
+@dataclass(slots=True)
 class Session[PTYHandle]:
     """Terminal session entity.
 
     This is the domain representation of a session.
     It does NOT hold WebSocket or any infrastructure references.
     The PTYHandle is a generic type provided by infrastructure.
+
+    Timestamps are monotonic seconds (time.monotonic()), used only for
+    age/idle arithmetic - they are not wall-clock times.
     """
 
     id: SessionId
     user_id: UserId
     shell_id: str
     dimensions: TerminalDimensions
-    created_at: datetime
-    last_activity: datetime
+    created_at: float
+    last_activity: float
 
     # PTY handle is generic - concrete type provided by infrastructure
     pty_handle: PTYHandle
@@ -60,7 +62,7 @@ class Session[PTYHandle]:
         """Check if any clients connected."""
         return self.connected_clients > 0
 
-    def touch(self, now: datetime) -> None:
+    def touch(self, now: float) -> None:
         """Update last activity timestamp."""
         self.last_activity = now
 
@@ -44,6 +44,14 @@ class PTYPort(ABC):
         """Close PTY and cleanup resources."""
         ...
 
+    def fileno(self) -> int | None:
+        """Get a file descriptor that becomes readable when output is available.
+
+        Returns None if the PTY cannot be watched for readiness,
+        in which case callers fall back to polling read().
+        """
+        return None
+
     @property
     @abstractmethod
     def dimensions(self) -> TerminalDimensions:
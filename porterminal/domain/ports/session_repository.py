@@ -29,7 +29,12 @@ class SessionRepository[PTYHandle](ABC):
 
     @abstractmethod
     def get_by_user(self, user_id: UserId) -> list[Session[PTYHandle]]:
-        """Get all sessions for a user."""
+        """Get all sessions for a user, least recently used first."""
+        ...
+
+    @abstractmethod
+    def mark_used(self, session_id: SessionId) -> None:
+        """Mark a session as most recently used for its user."""
         ...
 
     @abstractmethod
@@ -14,7 +14,7 @@ class Clock(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucketRateLimiter:
     """Pure token bucket rate limiter.
 
@@ -41,10 +41,13 @@ class TokenBucketRateLimiter:
             True if tokens were acquired, False if rate limited.
         """
         now = self.clock.now()
-        elapsed = now - self._last_update
 
-        # Refill bucket
-        self._tokens = min(self.config.burst, self._tokens + elapsed * self.config.rate)
+        # Refill bucket (a full bucket - the idle-then-type case - has nothing
+        # to refill, but the time is still recorded so idle time isn't
+        # credited after this acquire)
+        burst = self.config.burst
+        if self._tokens < burst:
+            self._tokens = min(burst, self._tokens + (now - self._last_update) * self.config.rate)
         self._last_update = now
 
         if self._tokens >= tokens:
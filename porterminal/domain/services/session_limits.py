@@ -1,7 +1,6 @@
 """Session limit checking service - pure business logic."""
 
 from dataclasses import dataclass
-from datetime import datetime
 from typing import TypeVar
 
 from ..entities.session import (
@@ -77,11 +76,16 @@ class SessionLimitChecker:
     def should_cleanup_session(
         self,
         session: Session,
-        now: datetime,
+        now: float,
         is_pty_alive: bool,
     ) -> tuple[bool, str | None]:
         """Check if a session should be cleaned up.
 
+        Args:
+            session: Session to check.
+            now: Current monotonic time (same clock as the session timestamps).
+            is_pty_alive: Whether the session's PTY process is running.
+
         Returns:
             Tuple of (should_cleanup, reason).
         """
@@ -91,13 +95,13 @@ class SessionLimitChecker:
 
         # Check max duration (0 = no limit)
         if self.config.max_duration_seconds > 0:
-            age = (now - session.created_at).total_seconds()
+            age = now - session.created_at
             if age > self.config.max_duration_seconds:
                 return True, "Exceeded max duration"
 
         # Check reconnection window (0 = no limit, only for disconnected sessions)
         if self.config.reconnect_window_seconds > 0 and not session.is_connected:
-            idle = (now - session.last_activity).total_seconds()
+            idle = now - session.last_activity
             if idle > self.config.reconnect_window_seconds:
                 return True, "Reconnection window expired"
 
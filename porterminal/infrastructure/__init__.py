@@ -1,19 +1,27 @@
 """Infrastructure utilities for Porterminal."""
 
 from .cloudflared import CloudflaredInstaller
-from .network import find_available_port, is_port_available
+from .network import find_available_port, is_port_available, tcp_probe
 from .registry import UserConnectionRegistry
 from .repositories import InMemorySessionRepository, InMemoryTabRepository
-from .server import drain_process_output, start_cloudflared, start_server, wait_for_server
+from .server import (
+    drain_process_output,
+    start_cloudflared,
+    start_server,
+    wait_for_server,
+    watch_processes,
+)
 
 __all__ = [
     "CloudflaredInstaller",
     "is_port_available",
     "find_available_port",
+    "tcp_probe",
     "start_server",
     "wait_for_server",
     "start_cloudflared",
     "drain_process_output",
+    "watch_processes",
     "InMemorySessionRepository",
     "InMemoryTabRepository",
     "UserConnectionRegistry",
@@ -22,6 +22,24 @@ def is_port_available(host: str, port: int) -> bool:
         return False
 
 
+def tcp_probe(host: str, port: int, timeout: float = 0.05) -> bool:
+    """Check if something is accepting TCP connections on host:port.
+
+    Args:
+        host: Host address to connect to.
+        port: Port number to connect to.
+        timeout: Connect timeout in seconds.
+
+    Returns:
+        True if the connection succeeded, False otherwise.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 def find_available_port(host: str, preferred_port: int, tries: int = 25) -> int:
     """Find an available port, starting at preferred_port and incrementing.
 
@@ -9,6 +9,10 @@ from porterminal.domain import UserId
 
 logger = logging.getLogger(__name__)
 
+# Per-connection send bound, so one stalled client cannot hold up a broadcast
+# (and the session teardown that awaits it)
+BROADCAST_SEND_TIMEOUT = 2.0  # seconds
+
 
 class UserConnectionRegistry:
     """Track all WebSocket connections per user for broadcasting.
@@ -74,7 +78,7 @@ class UserConnectionRegistry:
         # Send in parallel
         async def send_one(conn: ConnectionPort) -> bool:
             try:
-                await conn.send_message(message)
+                await asyncio.wait_for(conn.send_message(message), timeout=BROADCAST_SEND_TIMEOUT)
                 return True
             except Exception as e:
                 logger.warning("Failed to broadcast to connection: %s", e)
@@ -86,13 +90,14 @@ class UserConnectionRegistry:
         )
         count = sum(1 for r in results if r is True)
 
-        logger.debug(
-            "Broadcast to user_id=%s sent=%d/%d type=%s",
-            user_str,
-            count,
-            len(connections),
-            message.get("type"),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Broadcast to user_id=%s sent=%d/%d type=%s",
+                user_str,
+                count,
+                len(connections),
+                message.get("type"),
+            )
         return count
 
     def connection_count(self, user_id: UserId) -> int:
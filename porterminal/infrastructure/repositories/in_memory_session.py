@@ -1,5 +1,6 @@
 """In-memory session repository implementation."""
 
+from collections import OrderedDict
 from typing import TypeVar
 
 from porterminal.domain import Session, SessionId, UserId
@@ -12,11 +13,12 @@ class InMemorySessionRepository(SessionRepository[PTYHandle]):
     """In-memory session storage implementing SessionRepository.
 
     Thread-safe for async usage (dict operations are atomic in CPython).
+    Each user's sessions are kept in least-recently-used order.
     """
 
     def __init__(self) -> None:
         self._sessions: dict[str, Session[PTYHandle]] = {}
-        self._user_sessions: dict[str, set[str]] = {}
+        self._user_sessions: dict[str, OrderedDict[str, Session[PTYHandle]]] = {}
 
     def get(self, session_id: SessionId) -> Session[PTYHandle] | None:
         """Get session by ID."""
@@ -27,10 +29,15 @@ class InMemorySessionRepository(SessionRepository[PTYHandle]):
         return self._sessions.get(session_id)
 
     def get_by_user(self, user_id: UserId) -> list[Session[PTYHandle]]:
-        """Get all sessions for a user."""
-        user_str = str(user_id)
-        session_ids = self._user_sessions.get(user_str, set())
-        return [self._sessions[sid] for sid in session_ids if sid in self._sessions]
+        """Get all sessions for a user, least recently used first."""
+        user_sessions = self._user_sessions.get(str(user_id))
+        return list(user_sessions.values()) if user_sessions else []
+
+    def mark_used(self, session_id: SessionId) -> None:
+        """Mark a session as most recently used for its user."""
+        session = self._sessions.get(str(session_id))
+        if session:
+            self._user_sessions[str(session.user_id)].move_to_end(str(session_id))
 
     def add(self, session: Session[PTYHandle]) -> None:
         """Add a new session."""
@@ -40,8 +47,8 @@ class InMemorySessionRepository(SessionRepository[PTYHandle]):
         self._sessions[session_id] = session
 
         if user_id not in self._user_sessions:
-            self._user_sessions[user_id] = set()
-        self._user_sessions[user_id].add(session_id)
+            self._user_sessions[user_id] = OrderedDict()
+        self._user_sessions[user_id][session_id] = session
 
     def remove(self, session_id: SessionId) -> Session[PTYHandle] | None:
         """Remove and return a session."""
@@ -50,9 +57,10 @@ class InMemorySessionRepository(SessionRepository[PTYHandle]):
 
         if session:
             user_id = str(session.user_id)
-            if user_id in self._user_sessions:
-                self._user_sessions[user_id].discard(session_id_str)
-                if not self._user_sessions[user_id]:
+            user_sessions = self._user_sessions.get(user_id)
+            if user_sessions is not None:
+                user_sessions.pop(session_id_str, None)
+                if not user_sessions:
                     del self._user_sessions[user_id]
 
         return session
@@ -63,7 +71,7 @@ class InMemorySessionRepository(SessionRepository[PTYHandle]):
 
     def count_for_user(self, user_id: UserId) -> int:
         """Get session count for a user."""
-        return len(self._user_sessions.get(str(user_id), set()))
+        return len(self._user_sessions.get(str(user_id), ()))
 
     def all_sessions(self) -> list[Session[PTYHandle]]:
         """Get all sessions."""
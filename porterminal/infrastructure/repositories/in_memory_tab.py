@@ -13,8 +13,8 @@ class InMemoryTabRepository(TabRepository):
 
     def __init__(self) -> None:
         self._tabs: dict[str, Tab] = {}
-        self._user_tabs: dict[str, set[str]] = {}  # user_id -> {tab_ids}
-        self._session_tabs: dict[str, set[str]] = {}  # session_id -> {tab_ids}
+        self._user_tabs: dict[str, dict[str, Tab]] = {}  # user_id -> {tab_id: tab}
+        self._session_tabs: dict[str, dict[str, Tab]] = {}  # session_id -> {tab_id: tab}
 
     def get(self, tab_id: TabId) -> Tab | None:
         """Get tab by ID."""
@@ -26,16 +26,15 @@ class InMemoryTabRepository(TabRepository):
 
     def get_by_user(self, user_id: UserId) -> list[Tab]:
         """Get all tabs for a user (ordered by created_at ASC)."""
-        user_str = str(user_id)
-        tab_ids = self._user_tabs.get(user_str, set())
-        tabs = [self._tabs[tid] for tid in tab_ids if tid in self._tabs]
-        return sorted(tabs, key=lambda t: t.created_at)
+        user_tabs = self._user_tabs.get(str(user_id))
+        if not user_tabs:
+            return []
+        return sorted(user_tabs.values(), key=lambda t: t.created_at)
 
     def get_by_session(self, session_id: SessionId) -> list[Tab]:
         """Get all tabs referencing a specific session."""
-        session_str = str(session_id)
-        tab_ids = self._session_tabs.get(session_str, set())
-        return [self._tabs[tid] for tid in tab_ids if tid in self._tabs]
+        session_tabs = self._session_tabs.get(str(session_id))
+        return list(session_tabs.values()) if session_tabs else []
 
     def add(self, tab: Tab) -> None:
         """Add a new tab."""
@@ -45,21 +44,17 @@ class InMemoryTabRepository(TabRepository):
 
         self._tabs[tab_id] = tab
 
-        # Index by user
-        if user_id not in self._user_tabs:
-            self._user_tabs[user_id] = set()
-        self._user_tabs[user_id].add(tab_id)
-
-        # Index by session
-        if session_id not in self._session_tabs:
-            self._session_tabs[session_id] = set()
-        self._session_tabs[session_id].add(tab_id)
+        # Index by user and by session
+        self._user_tabs.setdefault(user_id, {})[tab_id] = tab
+        self._session_tabs.setdefault(session_id, {})[tab_id] = tab
 
     def update(self, tab: Tab) -> None:
         """Update an existing tab (name, last_accessed)."""
         tab_id = str(tab.id)
         if tab_id in self._tabs:
             self._tabs[tab_id] = tab
+            self._user_tabs[str(tab.user_id)][tab_id] = tab
+            self._session_tabs[str(tab.session_id)][tab_id] = tab
 
     def remove(self, tab_id: TabId) -> Tab | None:
         """Remove and return a tab."""
@@ -71,15 +66,17 @@ class InMemoryTabRepository(TabRepository):
             session_id = str(tab.session_id)
 
             # Clean up user index
-            if user_id in self._user_tabs:
-                self._user_tabs[user_id].discard(tab_id_str)
-                if not self._user_tabs[user_id]:
+            user_tabs = self._user_tabs.get(user_id)
+            if user_tabs is not None:
+                user_tabs.pop(tab_id_str, None)
+                if not user_tabs:
                     del self._user_tabs[user_id]
 
             # Clean up session index
-            if session_id in self._session_tabs:
-                self._session_tabs[session_id].discard(tab_id_str)
-                if not self._session_tabs[session_id]:
+            session_tabs = self._session_tabs.get(session_id)
+            if session_tabs is not None:
+                session_tabs.pop(tab_id_str, None)
+                if not session_tabs:
                     del self._session_tabs[session_id]
 
         return tab
@@ -90,25 +87,23 @@ class InMemoryTabRepository(TabRepository):
         Returns:
             List of removed tabs.
         """
-        session_str = str(session_id)
-        tab_ids = list(self._session_tabs.get(session_str, set()))
+        session_tabs = self._session_tabs.pop(str(session_id), None)
+        if not session_tabs:
+            return []
 
         removed = []
-        for tab_id_str in tab_ids:
+        for tab_id_str in session_tabs:
             tab = self._tabs.pop(tab_id_str, None)
             if tab:
                 removed.append(tab)
                 # Clean up user index
                 user_id = str(tab.user_id)
-                if user_id in self._user_tabs:
-                    self._user_tabs[user_id].discard(tab_id_str)
-                    if not self._user_tabs[user_id]:
+                user_tabs = self._user_tabs.get(user_id)
+                if user_tabs is not None:
+                    user_tabs.pop(tab_id_str, None)
+                    if not user_tabs:
                         del self._user_tabs[user_id]
 
-        # Clean up session index
-        if session_str in self._session_tabs:
-            del self._session_tabs[session_str]
-
         return removed
 
     def count(self) -> int:
@@ -117,4 +112,4 @@ class InMemoryTabRepository(TabRepository):
 
     def count_for_user(self, user_id: UserId) -> int:
         """Get tab count for a user."""
-        return len(self._user_tabs.get(str(user_id), set()))
+        return len(self._user_tabs.get(str(user_id), ()))
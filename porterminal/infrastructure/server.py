@@ -1,12 +1,17 @@
 """Server and tunnel management utilities."""
 
+import asyncio
 import json
 import os
 import re
+import signal
 import subprocess
 import sys
+import threading
 import time
 import urllib.request
+from collections.abc import Callable, Iterable
+from contextlib import suppress
 
 from rich.console import Console
 
@@ -19,7 +24,7 @@ def _is_icmp_warning(line: str) -> bool:
     return "icmp" in lower or "ping_group" in lower or "ping group" in lower
 
 
-def wait_for_server(host: str, port: int, timeout: int = 30) -> bool:
+def wait_for_server(host: str, port: int, timeout: float = 30) -> bool:
     """Wait for the server to be ready and verify it's Porterminal.
 
     Args:
@@ -163,6 +168,26 @@ def start_cloudflared(port: int) -> tuple[subprocess.Popen, str | None]:
     return process, url
 
 
+def _report_line(line: str) -> None:
+    """Print a drained output line if it is an error or security warning."""
+    line = line.strip()
+    if not line:
+        return
+    # Always print security warnings and related messages
+    if any(
+        kw in line.lower()
+        for kw in (
+            "security warning",
+            "authentication attempts",
+            "url may have been leaked",
+        )
+    ):
+        console.print(f"[bold red]{line}[/bold red]")
+    # Print errors, but ignore harmless ICMP/ping warnings
+    elif "error" in line.lower() and not _is_icmp_warning(line):
+        console.print(f"[red]{line}[/red]")
+
+
 def drain_process_output(process: subprocess.Popen) -> None:
     """Drain process output silently (only print errors and security warnings).
 
@@ -173,21 +198,145 @@ def drain_process_output(process: subprocess.Popen) -> None:
         for line in iter(process.stdout.readline, ""):
             if not line:
                 break
-            line = line.strip()
-            if not line:
-                continue
-            # Always print security warnings and related messages
-            if any(
-                kw in line.lower()
-                for kw in (
-                    "security warning",
-                    "authentication attempts",
-                    "url may have been leaked",
-                )
-            ):
-                console.print(f"[bold red]{line}[/bold red]")
-            # Print errors, but ignore harmless ICMP/ping warnings
-            elif "error" in line.lower() and not _is_icmp_warning(line):
-                console.print(f"[red]{line}[/red]")
+            _report_line(line)
     except (OSError, ValueError):
         pass
+
+
+def _run_in_daemon_thread(func: Callable[[], object]) -> asyncio.Future:
+    """Run a blocking call in a daemon thread and resolve a future with its result.
+
+    Unlike asyncio.to_thread(), a daemon thread never holds up event loop
+    shutdown (e.g. on Ctrl+C while the call is still blocked).
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result: object) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    def runner() -> None:
+        result = func()
+        with suppress(RuntimeError):  # Loop already closed
+            loop.call_soon_threadsafe(resolve, result)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+def _report_buffered_lines(process: subprocess.Popen) -> str:
+    """Report output already buffered in the process's stdout text stream.
+
+    start_cloudflared() reads with readline(), so lines past the URL can be
+    sitting in the stream's buffers, where reading the raw pipe would miss
+    them. Reads without blocking until the buffers (and pipe) are empty.
+
+    Returns:
+        A trailing partial line, to be completed by the next line read.
+    """
+    try:
+        # Left non-blocking: the event loop sets the pipe non-blocking anyway
+        os.set_blocking(process.stdout.fileno(), False)
+        while line := process.stdout.readline():
+            if not line.endswith("\n"):
+                return line
+            _report_line(line)
+    except (OSError, ValueError):
+        pass
+    return ""
+
+
+async def _drain_process_output_async(process: subprocess.Popen) -> None:
+    """Drain process output on the running event loop.
+
+    Args:
+        process: Subprocess to drain output from.
+    """
+    if sys.platform == "win32":
+        # Proactor pipes need overlapped handles, which Popen pipes are not
+        await _run_in_daemon_thread(lambda: drain_process_output(process))
+        return
+
+    partial = _report_buffered_lines(process)
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport: asyncio.BaseTransport | None = None
+    # The transport closes its pipe on EOF, so hand it a duplicate descriptor
+    pipe = os.fdopen(os.dup(process.stdout.fileno()), "rb", buffering=0)
+    try:
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+        while True:
+            try:
+                raw = await reader.readline()
+            except ValueError:
+                continue  # Overlong line was discarded, keep draining
+            if not raw:
+                break
+            _report_line(partial + raw.decode("utf-8", errors="replace"))
+            partial = ""
+        _report_line(partial)
+    except OSError:
+        pass
+    finally:
+        if transport is not None:
+            transport.close()
+        pipe.close()
+
+
+async def _wait_for_any_exit(processes: list[subprocess.Popen]) -> subprocess.Popen:
+    """Wait until one of the processes exits and return it.
+
+    On POSIX this sleeps until SIGCHLD arrives instead of blocking a thread
+    per process. Windows has no SIGCHLD, so each process gets a waiter thread.
+    """
+    if sys.platform == "win32":
+        waiters = {_run_in_daemon_thread(p.wait): p for p in processes}
+        done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        return waiters[done.pop()]
+
+    loop = asyncio.get_running_loop()
+    child_changed = asyncio.Event()
+    loop.add_signal_handler(signal.SIGCHLD, child_changed.set)
+    try:
+        while True:
+            # Checked before every wait, so an exit before the handler was installed is seen
+            for process in processes:
+                if process.poll() is not None:
+                    return process
+            await child_changed.wait()
+            child_changed.clear()
+    finally:
+        loop.remove_signal_handler(signal.SIGCHLD)
+
+
+async def watch_processes(
+    processes: Iterable[subprocess.Popen | None],
+    drain: Iterable[subprocess.Popen] = (),
+) -> subprocess.Popen | None:
+    """Drain process output and wait until any of the processes exits.
+
+    Everything runs on the current event loop, so there is no per-process
+    drain thread and no polling loop - process exits are signal-driven.
+
+    Args:
+        processes: Processes to watch (None entries are ignored).
+        drain: Processes whose piped output should be drained silently.
+
+    Returns:
+        The first process that exited. If there is nothing to watch, waits
+        until cancelled (e.g. by Ctrl+C).
+    """
+    drainers = [asyncio.create_task(_drain_process_output_async(p)) for p in drain]
+    try:
+        watched = [p for p in processes if p is not None]
+        if not watched:
+            await asyncio.Event().wait()
+        return await _wait_for_any_exit(watched)
+    finally:
+        for task in drainers:
+            task.cancel()
+        await asyncio.gather(*drainers, return_exceptions=True)
@@ -1,5 +1,6 @@
 """FastAPI WebSocket adapter implementing ConnectionPort."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -8,13 +9,27 @@ from starlette.websockets import WebSocketDisconnect
 
 from porterminal.application.ports import ConnectionPort
 
+# A half-open TCP peer can stall a close handshake until the OS times out
+CLOSE_TIMEOUT = 2.0  # seconds
+
+# WebSocket close code for a message too big to process (RFC 6455)
+CLOSE_MESSAGE_TOO_BIG = 1009
+
 
 class FastAPIWebSocketAdapter(ConnectionPort):
     """Adapts FastAPI WebSocket to ConnectionPort protocol."""
 
-    def __init__(self, websocket: WebSocket) -> None:
+    def __init__(self, websocket: WebSocket, max_text_size: int | None = None) -> None:
+        """Wrap a WebSocket.
+
+        Args:
+            websocket: Accepted FastAPI WebSocket.
+            max_text_size: Reject text frames longer than this before JSON
+                parsing (None = no limit).
+        """
         self._websocket = websocket
         self._closed = False
+        self._max_text_size = max_text_size
 
     async def send_output(self, data: bytes) -> None:
         """Send terminal output to client."""
@@ -32,14 +47,25 @@ class FastAPIWebSocketAdapter(ConnectionPort):
             except Exception:
                 self._closed = True
 
-    async def receive(self) -> dict[str, Any] | bytes:
+    async def send_text(self, text: str) -> None:
+        """Send an already-encoded JSON control message to client."""
+        if not self._closed:
+            try:
+                await self._websocket.send_text(text)
+            except Exception:
+                self._closed = True
+
+    async def receive(self) -> dict[str, Any] | list[Any] | bytes:
         """Receive message from client (binary or JSON).
 
         Returns:
-            bytes for terminal input, dict for control messages.
+            bytes for terminal input, dict for control messages, list for a
+            batch of control messages sent in one frame.
 
         Raises:
             WebSocketDisconnect: If connection is closed.
+            ValueError: If a text frame exceeds max_text_size (the connection
+                is closed with 1009 first).
         """
         try:
             message = await self._websocket.receive()
@@ -49,8 +75,11 @@ class FastAPIWebSocketAdapter(ConnectionPort):
 
         if message.get("bytes"):
             return message["bytes"]
-        elif message.get("text"):
-            return json.loads(message["text"])
+        elif text := message.get("text"):
+            if self._max_text_size is not None and len(text) > self._max_text_size:
+                await self.close(code=CLOSE_MESSAGE_TOO_BIG, reason="Message too big")
+                raise ValueError(f"Text message too large ({len(text)} chars)")
+            return json.loads(text)
 
         # Handle disconnect message
         if message.get("type") == "websocket.disconnect":
@@ -64,7 +93,9 @@ class FastAPIWebSocketAdapter(ConnectionPort):
         if not self._closed:
             self._closed = True
             try:
-                await self._websocket.close(code=code, reason=reason)
+                await asyncio.wait_for(
+                    self._websocket.close(code=code, reason=reason), timeout=CLOSE_TIMEOUT
+                )
             except Exception:
                 pass
 
@@ -153,6 +153,16 @@ class SecurePTYManager:
             return False
         return self._backend.is_alive()
 
+    def fileno(self) -> int | None:
+        """Get a file descriptor that becomes readable when output is available.
+
+        Returns:
+            The descriptor, or None if closed or not supported by the backend.
+        """
+        if self._closed:
+            return None
+        return self._backend.fileno()
+
     def close(self) -> None:
         """Close the PTY and clean up resources."""
         if self._closed:
@@ -82,3 +82,11 @@ class PTYBackend(Protocol):
     def close(self) -> None:
         """Close the PTY and clean up resources."""
         ...
+
+    def fileno(self) -> int | None:
+        """Get a file descriptor that becomes readable when output is available.
+
+        Returns:
+            The descriptor, or None if readiness cannot be watched.
+        """
+        ...
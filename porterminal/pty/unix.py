@@ -27,6 +27,8 @@ class UnixPTYBackend:
         self._pid: int | None = None
         self._rows: int = 30
         self._cols: int = 120
+        # Per-read/write debug logging is decided once at spawn, not per call.
+        self._log_io: bool = False
 
     @property
     def rows(self) -> int:
@@ -52,6 +54,7 @@ class UnixPTYBackend:
 
         self._rows = rows
         self._cols = cols
+        self._log_io = logger.isEnabledFor(logging.DEBUG)
 
         self._pid, self._master_fd = pty.fork()
 
@@ -86,7 +89,7 @@ class UnixPTYBackend:
 
         try:
             data = os.read(self._master_fd, size)
-            if data:
+            if data and self._log_io:
                 logger.debug("PTY read bytes=%d", len(data))
             return data
         except OSError:
@@ -96,7 +99,8 @@ class UnixPTYBackend:
         """Write to Unix PTY."""
         if self._master_fd is None:
             return
-        logger.debug("PTY write bytes=%d", len(data))
+        if self._log_io:
+            logger.debug("PTY write bytes=%d", len(data))
         os.write(self._master_fd, data)
 
     def resize(self, rows: int, cols: int) -> None:
@@ -116,6 +120,10 @@ class UnixPTYBackend:
         except ChildProcessError:
             return False
 
+    def fileno(self) -> int | None:
+        """Get the PTY master file descriptor."""
+        return self._master_fd
+
     def close(self) -> None:
         """Close the PTY and clean up resources."""
         try:
@@ -26,6 +26,8 @@ class WindowsPTYBackend:
         self._pty: Any | None = None
         self._rows: int = 30
         self._cols: int = 120
+        # Per-read/write debug logging is decided once at spawn, not per call.
+        self._log_io: bool = False
 
     @property
     def rows(self) -> int:
@@ -51,6 +53,7 @@ class WindowsPTYBackend:
 
         self._rows = rows
         self._cols = cols
+        self._log_io = logger.isEnabledFor(logging.DEBUG)
 
         self._pty = WinPtyProcess.spawn(
             cmd,
@@ -75,13 +78,14 @@ class WindowsPTYBackend:
             # Filter out pywinpty noise
             if not data or data == b"0011Ignore":
                 return b""
-            logger.debug("PTY read bytes=%d", len(data))
+            if self._log_io:
+                logger.debug("PTY read bytes=%d", len(data))
             return data
 
         # Fallback to blocking read
         data = self._pty.read(size)
-        data_bytes = data.encode("utf-8") if isinstance(data, str) else data
-        if data_bytes:
+        data_bytes = data.encode() if isinstance(data, str) else data
+        if data_bytes and self._log_io:
             logger.debug("PTY read bytes=%d", len(data_bytes))
         return data_bytes
 
@@ -89,8 +93,9 @@ class WindowsPTYBackend:
         """Write to Windows PTY."""
         if self._pty is None:
             return
-        text = data.decode("utf-8", errors="replace")
-        logger.debug("PTY write bytes=%d", len(data))
+        text = data.decode(errors="replace")
+        if self._log_io:
+            logger.debug("PTY write bytes=%d", len(data))
         self._pty.write(text)
 
     def resize(self, rows: int, cols: int) -> None:
@@ -106,6 +111,10 @@ class WindowsPTYBackend:
         """Check if the PTY process is still alive."""
         return self._pty is not None and self._pty.isalive()
 
+    def fileno(self) -> int | None:
+        """Readiness watching is not supported (the proactor loop has no add_reader)."""
+        return None
+
     def close(self) -> None:
         """Close the PTY with grace period before force kill."""
         if self._pty is None:
@@ -4,7 +4,10 @@ import json
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from urllib.error import URLError
 from urllib.request import Request, urlopen
@@ -34,22 +37,38 @@ def _detect_install_method() -> str:
     return "pip"
 
 
-def _is_newer(latest: str, current: str) -> bool:
-    """Return True if latest > current."""
+@cache
+def _version_class() -> type | None:
+    """Return packaging's Version class, or None if packaging is unavailable.
+
+    Resolved once on first use rather than at import, keeping packaging off
+    the startup path.
+    """
     try:
         from packaging.version import Version
+    except ImportError:
+        return None
+    return Version
 
-        return Version(latest) > Version(current)
-    except Exception:
-        # Fallback: tuple comparison (handles 0.9 vs 0.10 correctly)
-        def to_tuple(v: str) -> tuple[int, ...]:
-            v = v.lstrip("v").split("+")[0].split(".dev")[0]
-            return tuple(int(p) for p in v.split(".")[:3] if p.isdigit())
 
+def _is_newer(latest: str, current: str) -> bool:
+    """Return True if latest > current."""
+    version_class = _version_class()
+    if version_class is not None:
         try:
-            return to_tuple(latest) > to_tuple(current)
-        except ValueError:
-            return False
+            return version_class(latest) > version_class(current)
+        except Exception:
+            pass
+
+    # Fallback: tuple comparison (handles 0.9 vs 0.10 correctly)
+    def to_tuple(v: str) -> tuple[int, ...]:
+        v = v.lstrip("v").split("+")[0].split(".dev")[0]
+        return tuple(int(p) for p in v.split(".")[:3] if p.isdigit())
+
+    try:
+        return to_tuple(latest) > to_tuple(current)
+    except ValueError:
+        return False
 
 
 def _get_check_interval() -> int:
@@ -62,22 +81,25 @@ def _get_check_interval() -> int:
         return 86400  # Default 24h
 
 
+def _cache_age() -> float | None:
+    """Seconds since the cache was last written (its mtime), or None if missing."""
+    try:
+        return time.time() - CACHE_FILE.stat().st_mtime
+    except OSError:
+        return None
+
+
 def _should_check() -> bool:
     """Check if enough time passed since last check."""
-    if not CACHE_FILE.exists():
-        return True
-    try:
-        data = json.loads(CACHE_FILE.read_text())
-        return time.time() - data.get("timestamp", 0) > _get_check_interval()
-    except (OSError, json.JSONDecodeError, KeyError):
-        return True
+    age = _cache_age()
+    return age is None or age > _get_check_interval()
 
 
 def _save_cache(version: str) -> None:
-    """Save check result to cache."""
+    """Save check result to cache (the file's mtime records the check time)."""
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        CACHE_FILE.write_text(json.dumps({"version": version, "timestamp": time.time()}))
+        CACHE_FILE.write_text(json.dumps({"version": version}))
     except OSError:
         pass
 
@@ -92,12 +114,10 @@ def get_latest_version(use_cache: bool = True) -> str | None:
         Latest version string or None if fetch failed.
     """
     # Try cache first
-    if use_cache and CACHE_FILE.exists():
+    if use_cache and not _should_check():
         try:
-            data = json.loads(CACHE_FILE.read_text())
-            if time.time() - data.get("timestamp", 0) < _get_check_interval():
-                return data.get("version")
-        except (OSError, json.JSONDecodeError, KeyError):
+            return json.loads(CACHE_FILE.read_text()).get("version")
+        except (OSError, json.JSONDecodeError, AttributeError):
             pass
 
     # Fetch from PyPI
@@ -188,23 +208,56 @@ def update_package() -> bool:
         return False
 
 
-def check_and_notify() -> None:
-    """Check for updates and print notification if available.
+def _print_update_notice(latest: str) -> None:
+    """Print the update available notification."""
+    print(f"Update available: {__version__} -> {latest}. Run: {get_upgrade_command()}")
+
+
+def start_update_check() -> Callable[[], None]:
+    """Start the startup update check on a background thread.
+
+    Respects config settings and the check interval, never exec's. The PyPI
+    request runs on a daemon thread so startup is never gated on the network.
 
-    Call at startup. Non-blocking, respects config settings, never exec's.
+    Returns:
+        A function that prints the update notification once the startup
+        output is done. It never blocks: if the check is still running, the
+        thread prints the notification itself when it finishes.
     """
     # Check if notifications are enabled
     try:
         from porterminal.config import get_config
 
         if not get_config().update.notify_on_startup:
-            return
+            return lambda: None
     except Exception:
         pass  # Default to enabled if config fails
 
     if not _should_check():
-        return
+        return lambda: None
 
-    has_update, latest = check_for_updates(use_cache=False)
-    if has_update and latest:
-        print(f"Update available: {__version__} -> {latest}. Run: {get_upgrade_command()}")
+    lock = threading.Lock()
+    found: list[str] = []
+    notified = False
+
+    def check() -> None:
+        has_update, latest = check_for_updates(use_cache=False)
+        if not (has_update and latest):
+            return
+        with lock:
+            found.append(latest)
+            if not notified:
+                return  # notify() prints it
+        _print_update_notice(latest)
+
+    threading.Thread(target=check, daemon=True).start()
+
+    def notify() -> None:
+        nonlocal notified
+        with lock:
+            notified = True
+            latest = found[0] if found else None
+        if latest:
+            _print_update_notice(latest)
+
+    return notify
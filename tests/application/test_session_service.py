@@ -0,0 +1,176 @@
+"""Tests for SessionService."""
+
+import asyncio
+
+import pytest
+
+from porterminal.application.services import (
+    ManagementService,
+    SessionService,
+    TabService,
+    TerminalService,
+)
+from porterminal.domain import SessionLimitChecker, SessionLimitConfig, TabLimitChecker, UserId
+from tests.conftest import FakePTY, MockConnection
+
+
+def create_service(
+    session_repository, ptys: list[FakePTY], max_per_user: int = 10
+) -> SessionService:
+    """Create a SessionService whose factory hands out a fresh FakePTY per session."""
+
+    def factory(shell, dimensions, env, cwd=None):
+        pty = FakePTY(dimensions)
+        pty.spawn()
+        ptys.append(pty)
+        return pty
+
+    return SessionService(
+        session_repository,
+        factory,
+        limit_checker=SessionLimitChecker(SessionLimitConfig(max_per_user=max_per_user)),
+    )
+
+
+class DisconnectingConnection(MockConnection):
+    """Connection whose client goes away on the first receive."""
+
+    async def receive(self) -> dict | list | bytes:
+        self._is_connected = False
+        raise ConnectionError("client disconnected")
+
+
+class TestSessionServiceCleanup:
+    """Tests for stale session cleanup."""
+
+    async def test_cleanup_removes_only_dead_sessions(
+        self, session_repository, bash_shell, default_dimensions
+    ):
+        """Test that sessions with dead PTYs are destroyed and live ones kept."""
+        ptys: list[FakePTY] = []
+        service = create_service(session_repository, ptys)
+        user = UserId("cleanup-user")
+        sessions = [
+            await service.create_session(user, bash_shell, default_dimensions) for _ in range(3)
+        ]
+        ptys[0].kill()
+        ptys[2].kill()
+
+        await service._cleanup_stale_sessions()
+
+        assert service.session_count() == 1
+        assert service.get_session(sessions[1].session_id) is sessions[1]
+
+    async def test_cleanup_destroys_sessions_concurrently(
+        self, session_repository, bash_shell, default_dimensions
+    ):
+        """Test that a slow destroy callback does not serialize cleanup."""
+        ptys: list[FakePTY] = []
+        service = create_service(session_repository, ptys)
+        user = UserId("cleanup-user")
+        for _ in range(3):
+            await service.create_session(user, bash_shell, default_dimensions)
+        for pty in ptys:
+            pty.kill()
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def on_destroyed(session_id, user_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        service.set_on_session_destroyed(on_destroyed)
+
+        await service._cleanup_stale_sessions()
+
+        assert service.session_count() == 0
+        assert max_in_flight == 3
+
+
+class TestSessionServiceLimits:
+    """Tests for per-user session limits."""
+
+    async def test_create_evicts_least_recently_used_idle_session(
+        self, session_repository, bash_shell, default_dimensions
+    ):
+        """Test that hitting the limit evicts the LRU session without clients."""
+        service = create_service(session_repository, [], max_per_user=2)
+        user = UserId("limit-user")
+        first = await service.create_session(user, bash_shell, default_dimensions)
+        second = await service.create_session(user, bash_shell, default_dimensions)
+        await service.reconnect_session(first.id, user)
+        service.disconnect_session(first.id)
+
+        third = await service.create_session(user, bash_shell, default_dimensions)
+
+        assert service.get_session(second.session_id) is None
+        assert service.get_user_sessions(user) == [first, third]
+
+    async def test_create_raises_when_all_sessions_connected(
+        self, session_repository, bash_shell, default_dimensions
+    ):
+        """Test that sessions with connected clients are never evicted."""
+        service = create_service(session_repository, [], max_per_user=1)
+        user = UserId("limit-user")
+        session = await service.create_session(user, bash_shell, default_dimensions)
+        session.add_client()
+
+        with pytest.raises(ValueError):
+            await service.create_session(user, bash_shell, default_dimensions)
+
+        assert service.get_session(session.session_id) is session
+
+    async def test_create_tab_evicts_session_of_disconnected_tab(
+        self,
+        session_repository,
+        tab_repository,
+        connection_registry,
+        bash_shell,
+        default_dimensions,
+    ):
+        """Test eviction through the management flow: create tab, connect, disconnect.
+
+        The tab keeps a client reference on its session, so eviction must go by
+        live terminal connections rather than connected_clients.
+        """
+        ptys: list[FakePTY] = []
+        session_service = create_service(session_repository, ptys, max_per_user=1)
+        tab_service = TabService(tab_repository, TabLimitChecker())
+        terminal_service = TerminalService()
+        session_service.set_connection_checker(
+            lambda session_id: terminal_service.has_connections(str(session_id))
+        )
+        management = ManagementService(
+            session_service,
+            tab_service,
+            connection_registry,
+            lambda shell_id: bash_shell,
+            default_dimensions,
+        )
+        user = UserId("limit-user")
+        management_connection = MockConnection()
+
+        await management.handle_message(
+            user, management_connection, {"type": "create_tab", "request_id": "1"}
+        )
+        first_tab = management_connection.sent_messages[-1]["tab"]
+
+        # Terminal client connects, then drops
+        session = await session_service.reconnect_session(
+            tab_service.get_tab(first_tab["id"]).session_id, user
+        )
+        await terminal_service.handle_session(session, DisconnectingConnection())
+        session_service.disconnect_session(session.id)
+        assert session.is_connected  # Still held by the tab
+
+        await management.handle_message(
+            user, management_connection, {"type": "create_tab", "request_id": "2"}
+        )
+
+        assert management_connection.sent_messages[-1]["success"] is True
+        assert session_service.get_session(session.session_id) is None
+        assert not ptys[0].is_alive()
@@ -0,0 +1,345 @@
+"""Tests for TerminalService."""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+from porterminal.application.services import TerminalService
+from porterminal.application.services.terminal_service import (
+    MAX_INPUT_SIZE,
+    PTY_READ_MAX_PER_TICK,
+)
+from porterminal.domain import RateLimitConfig, TokenBucketRateLimiter
+
+
+class TestTerminalServicePTYRead:
+    """Tests for PTY read coalescing."""
+
+    def test_read_available_coalesces_chunks(self, fake_pty):
+        """Test that all pending PTY output is returned in one read."""
+        fake_pty.add_output(b"hello ")
+        fake_pty.add_output(b"world")
+
+        assert TerminalService._read_available(fake_pty) == b"hello world"
+        assert TerminalService._read_available(fake_pty) == b""
+
+    def test_read_available_caps_bytes_per_tick(self, fake_pty):
+        """Test that a single poll drains at most PTY_READ_MAX_PER_TICK bytes."""
+        chunk = b"x" * 65536
+        for _ in range(PTY_READ_MAX_PER_TICK // len(chunk) + 1):
+            fake_pty.add_output(chunk)
+
+        assert len(TerminalService._read_available(fake_pty)) == PTY_READ_MAX_PER_TICK
+        assert TerminalService._read_available(fake_pty) == chunk
+
+
+class PipePTY:
+    """PTY stand-in backed by a pipe, so the read loop can watch a real fd."""
+
+    def __init__(self, dimensions):
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._dimensions = dimensions
+        self._closed = False
+
+    def feed(self, data: bytes) -> None:
+        os.write(self._write_fd, data)
+
+    def read(self, size: int = 4096) -> bytes:
+        if self._closed:
+            return b""
+        try:
+            return os.read(self._read_fd, size)
+        except BlockingIOError:
+            return b""
+
+    def write(self, data: bytes) -> None:
+        pass
+
+    def resize(self, dimensions) -> None:
+        self._dimensions = dimensions
+
+    def is_alive(self) -> bool:
+        return not self._closed
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+
+    def fileno(self) -> int | None:
+        return None if self._closed else self._read_fd
+
+    @property
+    def dimensions(self):
+        return self._dimensions
+
+
+class ClosePTYOnSendConnection:
+    """Connection that closes the PTY while output is being sent (tab closed)."""
+
+    def __init__(self, pty: PipePTY):
+        self._pty = pty
+        self.outputs: list[bytes] = []
+
+    async def send_output(self, data: bytes) -> None:
+        self.outputs.append(data)
+        await asyncio.sleep(0)
+        self._pty.close()
+
+    def is_connected(self) -> bool:
+        return True
+
+
+class ScriptedConnection:
+    """Connection that returns queued frames without yielding, then disconnects."""
+
+    def __init__(self, frames: list[object]):
+        self._frames = list(frames)
+        self.sent_messages: list[dict] = []
+
+    async def receive(self) -> dict | list | bytes:
+        if not self._frames:
+            raise ConnectionError("client disconnected")
+        return self._frames.pop(0)
+
+    async def send_text(self, text: str) -> None:
+        self.sent_messages.append(json.loads(text))
+
+    async def send_message(self, message: dict) -> None:
+        self.sent_messages.append(message)
+
+    def is_connected(self) -> bool:
+        return bool(self._frames)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Proactor loop has no add_reader")
+class TestTerminalServiceBroadcastLoop:
+    """Tests for the PTY read/broadcast loop."""
+
+    async def test_pty_closed_during_send_ends_loop(self, sample_session, default_dimensions):
+        """Test that a PTY closed mid-flush ends the loop instead of watching a stale fd."""
+        pty = PipePTY(default_dimensions)
+        sample_session.pty_handle = pty
+        session_id = str(sample_session.id)
+        connection = ClosePTYOnSendConnection(pty)
+        service = TerminalService()
+        service._register_connection(session_id, connection)
+
+        pty.feed(b"hello")
+        await asyncio.wait_for(service._read_pty_broadcast_loop(sample_session, session_id), 2)
+
+        assert connection.outputs[0] == b"hello"
+        assert not any(b"PTY error" in output for output in connection.outputs)
+
+
+class TestTerminalServiceBinaryInput:
+    """Tests for binary input handling."""
+
+    async def test_binary_input_written_to_pty(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that plain keystrokes reach the PTY unchanged."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+
+        await TerminalService()._handle_binary_input(
+            sample_session, b"ls\r", limiter, mock_connection
+        )
+        await asyncio.sleep(0)  # Let the coalesced write flush
+
+        assert sample_session.pty_handle.get_input() == b"ls\r"
+
+    async def test_binary_input_strips_terminal_responses(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that DA/CPR responses are filtered and other escapes kept."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        service = TerminalService()
+
+        await service._handle_binary_input(
+            sample_session, b"\x1b[?1;2c\x1b[A\x1b[12;1R", limiter, mock_connection
+        )
+        await service._handle_binary_input(sample_session, b"\x1b[5;5R", limiter, mock_connection)
+        await asyncio.sleep(0)
+
+        assert sample_session.pty_handle.get_input() == b"\x1b[A"
+        assert mock_connection.sent_messages == []
+
+    async def test_binary_input_too_large_sends_error(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that oversized input is rejected with an error message."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        service = TerminalService(max_input_size=4)
+
+        await service._handle_binary_input(sample_session, b"12345", limiter, mock_connection)
+
+        assert sample_session.pty_handle.get_input() == b""
+        assert mock_connection.sent_messages == [{"type": "error", "message": "Input too large"}]
+
+    async def test_json_input_strips_terminal_responses(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that JSON input is UTF-8 encoded and DA/CPR responses filtered."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+
+        await TerminalService()._handle_json_input(
+            sample_session, {"data": "é\x1b[?1;2c\r"}, limiter, mock_connection
+        )
+        await asyncio.sleep(0)
+
+        assert sample_session.pty_handle.get_input() == "é\r".encode()
+
+    async def test_max_size_non_bmp_json_input_fits_text_frame_limit(
+        self, sample_session, fake_clock, mock_connection
+    ):
+        """Test that non-BMP input at the size limit fits the text frame limit.
+
+        json.dumps escapes each such character as a 12-char surrogate pair.
+        """
+        limiter = TokenBucketRateLimiter(RateLimitConfig(burst=1 << 20), fake_clock)
+        service = TerminalService()
+        data = "\U0001f600" * MAX_INPUT_SIZE
+        frame = json.dumps({"type": "input", "data": data})
+
+        assert len(frame) <= service.max_text_message_size
+
+        await service._handle_json_input(
+            sample_session, json.loads(frame), limiter, mock_connection
+        )
+        await asyncio.sleep(0)
+
+        assert sample_session.pty_handle.get_input() == data.encode()
+        assert mock_connection.sent_messages == []
+
+    async def test_input_frames_coalesced_into_one_write(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that frames handled in the same loop turn reach the PTY in one write."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        service = TerminalService()
+        writes: list[bytes] = []
+        sample_session.pty_handle.write = writes.append
+
+        for key in (b"a", b"b", b"c"):
+            await service._handle_binary_input(sample_session, key, limiter, mock_connection)
+        assert writes == []
+
+        await asyncio.sleep(0)
+
+        assert writes == [b"abc"]
+
+
+class TestTerminalServiceResize:
+    """Tests for resize handling."""
+
+    async def test_resize_applied_for_single_client(self, sample_session, mock_connection):
+        """Test that a lone client can resize the terminal."""
+        await TerminalService()._handle_resize(
+            sample_session, {"type": "resize", "cols": 100, "rows": 40}, mock_connection
+        )
+
+        assert sample_session.dimensions.cols == 100
+        assert sample_session.dimensions.rows == 40
+        assert sample_session.pty_handle.dimensions == sample_session.dimensions
+
+    async def test_resize_does_not_overtake_earlier_input(
+        self, sample_session, rate_limit_config, fake_clock
+    ):
+        """Test that input queued in the same loop turn is written before a resize."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        events: list[object] = []
+        sample_session.pty_handle.write = events.append
+        sample_session.pty_handle.resize = lambda dims: events.append((dims.cols, dims.rows))
+        connection = ScriptedConnection([b"echo hi\r", {"type": "resize", "cols": 100, "rows": 40}])
+
+        await TerminalService()._handle_input_loop(sample_session, connection, limiter)
+        await asyncio.sleep(0)
+
+        assert events == [b"echo hi\r", (100, 40)]
+
+    async def test_resize_with_non_integer_dimensions_ignored(
+        self, sample_session, mock_connection
+    ):
+        """Test that non-integer dimensions are rejected without raising."""
+        before = sample_session.dimensions
+
+        await TerminalService()._handle_resize(
+            sample_session, {"type": "resize", "cols": "100", "rows": 40.0}, mock_connection
+        )
+
+        assert sample_session.dimensions == before
+
+
+class TestTerminalServiceJsonBatch:
+    """Tests for batched JSON messages."""
+
+    async def test_batched_input_written_once(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that consecutive input in a batch reaches the PTY in one write."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        service = TerminalService()
+        writes: list[bytes] = []
+        sample_session.pty_handle.write = writes.append
+
+        await service._handle_json_batch(
+            sample_session,
+            [
+                {"type": "input", "data": "ls"},
+                {"type": "input", "data": " -la\r"},
+                {"type": "ping"},
+            ],
+            limiter,
+            mock_connection,
+        )
+        await asyncio.sleep(0)
+
+        assert writes == [b"ls -la\r"]
+        assert mock_connection.sent_messages == [{"type": "pong"}]
+
+    async def test_batch_applied_in_order(
+        self, sample_session, rate_limit_config, fake_clock, mock_connection
+    ):
+        """Test that input before a resize in a batch is written before the resize."""
+        limiter = TokenBucketRateLimiter(rate_limit_config, fake_clock)
+        events: list[object] = []
+        sample_session.pty_handle.write = events.append
+        sample_session.pty_handle.resize = lambda dims: events.append((dims.cols, dims.rows))
+
+        await TerminalService()._handle_json_batch(
+            sample_session,
+            [
+                {"type": "input", "data": "a"},
+                {"type": "resize", "cols": 100, "rows": 40},
+                {"type": "input", "data": "b"},
+            ],
+            limiter,
+            mock_connection,
+        )
+        await asyncio.sleep(0)
+
+        assert events == [b"a", (100, 40), b"b"]
+
+    async def test_batch_size_checked_per_message(
+        self, sample_session, fake_clock, mock_connection
+    ):
+        """Test that a batch accepts input that is valid when sent message by message."""
+        limiter = TokenBucketRateLimiter(RateLimitConfig(burst=1 << 20), fake_clock)
+        writes: list[bytes] = []
+        sample_session.pty_handle.write = writes.append
+
+        await TerminalService(max_input_size=4096)._handle_json_batch(
+            sample_session,
+            [{"type": "input", "data": "a" * 3000}, {"type": "input", "data": "b" * 3000}],
+            limiter,
+            mock_connection,
+        )
+        await asyncio.sleep(0)
+
+        assert writes == [b"a" * 3000 + b"b" * 3000]
+        assert mock_connection.sent_messages == []
@@ -1,5 +1,8 @@
 """Shared test fixtures and configuration."""
 
+import json
+import time
+from collections import deque
 from datetime import UTC, datetime
 
 import pytest
@@ -122,23 +125,45 @@ def fake_clock():
 class FakePTY:
     """Fake PTY for testing."""
 
-    def __init__(self, dimensions: TerminalDimensions):
+    def __init__(
+        self,
+        dimensions: TerminalDimensions,
+        max_output: int = 1 << 20,
+        max_input: int = 1 << 20,
+    ):
         self._dimensions = dimensions
         self._alive = True
-        self._output_queue: list[bytes] = []
-        self._input_received: list[bytes] = []
+        self._max_output = max_output
+        self._max_input = max_input
+        self._output_queue: deque[bytes] = deque()
+        self._queued_output = 0
+        self._head: bytes | None = None
+        self._head_off = 0
+        self._input_buffer = bytearray()
         self._spawned = False
 
     def spawn(self) -> None:
         self._spawned = True
 
     def read(self, size: int = 4096) -> bytes:
-        if self._output_queue:
-            return self._output_queue.pop(0)
-        return b""
+        while self._head is None or self._head_off >= len(self._head):
+            if not self._output_queue:
+                return b""
+            self._head = self._output_queue.popleft()
+            self._queued_output -= len(self._head)
+            self._head_off = 0
+        if self._head_off == 0 and size >= len(self._head):
+            data = self._head
+        else:
+            data = bytes(memoryview(self._head)[self._head_off : self._head_off + size])
+        self._head_off += len(data)
+        return data
 
     def write(self, data: bytes) -> None:
-        self._input_received.append(data)
+        self._input_buffer.extend(data)
+        overflow = len(self._input_buffer) - self._max_input
+        if overflow > 0:
+            del self._input_buffer[:overflow]
 
     def resize(self, dimensions: TerminalDimensions) -> None:
         self._dimensions = dimensions
@@ -149,22 +174,30 @@ class FakePTY:
     def close(self) -> None:
         self._alive = False
 
+    def fileno(self) -> int | None:
+        return None
+
     @property
     def dimensions(self) -> TerminalDimensions:
         return self._dimensions
 
     # Test helpers
     def add_output(self, data: bytes) -> None:
-        """Add data to be returned by read()."""
+        """Add data to be returned by read() (drops oldest chunks past max_output)."""
         self._output_queue.append(data)
+        self._queued_output += len(data)
+        while self._queued_output > self._max_output and len(self._output_queue) > 1:
+            self._queued_output -= len(self._output_queue.popleft())
 
     def kill(self) -> None:
         """Simulate PTY death."""
         self._alive = False
 
-    def get_input(self) -> list[bytes]:
-        """Get all input received."""
-        return self._input_received
+    def get_input(self) -> bytes:
+        """Get (and drain) all input received."""
+        result = bytes(self._input_buffer)
+        self._input_buffer.clear()
+        return result
 
 
 @pytest.fixture
@@ -196,7 +229,7 @@ def fake_pty_factory(fake_pty):
 @pytest.fixture
 def sample_session(session_id, user_id, default_dimensions, fake_pty):
     """Sample session for testing."""
-    now = datetime.now(UTC)
+    now = time.monotonic()
     session = Session(
         id=session_id,
         user_id=user_id,
@@ -272,10 +305,13 @@ class MockConnection:
     async def send_message(self, message: dict) -> None:
         self.sent_messages.append(message)
 
+    async def send_text(self, text: str) -> None:
+        self.sent_messages.append(json.loads(text))
+
     async def send_output(self, data: bytes) -> None:
         pass
 
-    async def receive(self) -> dict | bytes:
+    async def receive(self) -> dict | list | bytes:
         return b""
 
     async def close(self, code: int = 1000, reason: str = "") -> None:
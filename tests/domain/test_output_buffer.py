@@ -0,0 +1,53 @@
+"""Tests for OutputBuffer entity."""
+
+from porterminal.domain import CLEAR_SCREEN_SEQUENCE, OutputBuffer
+
+
+class TestOutputBuffer:
+    """Tests for OutputBuffer."""
+
+    def test_starts_empty(self, output_buffer):
+        """Test that a new buffer is empty."""
+        assert output_buffer.is_empty
+        assert output_buffer.size == 0
+        assert output_buffer.get_all() == b""
+
+    def test_add_concatenates_chunks(self, output_buffer):
+        """Test that chunks are returned in order as one bytes object."""
+        output_buffer.add(b"hello ")
+        output_buffer.add(b"world")
+
+        assert output_buffer.get_all() == b"hello world"
+        assert output_buffer.size == 11
+
+    def test_trims_oldest_bytes_over_limit(self):
+        """Test that only the most recent max_bytes are kept."""
+        buffer = OutputBuffer(max_bytes=8)
+
+        buffer.add(b"abcdef")
+        buffer.add(b"ghijkl")
+
+        assert buffer.get_all() == b"efghijkl"
+        assert buffer.size == 8
+
+    def test_clear_screen_keeps_only_content_after_last_clear(self, output_buffer):
+        """Test that ED2 drops earlier output."""
+        output_buffer.add(b"old output")
+        output_buffer.add(b"x" + CLEAR_SCREEN_SEQUENCE + b"y" + CLEAR_SCREEN_SEQUENCE + b"new")
+
+        assert output_buffer.get_all() == b"new"
+
+    def test_clear_screen_at_end_leaves_buffer_empty(self, output_buffer):
+        """Test that ED2 with nothing after it empties the buffer."""
+        output_buffer.add(b"old output")
+        output_buffer.add(b"prompt" + CLEAR_SCREEN_SEQUENCE)
+
+        assert output_buffer.is_empty
+
+    def test_clear(self, output_buffer):
+        """Test clearing the buffer."""
+        output_buffer.add(b"data")
+
+        output_buffer.clear()
+
+        assert output_buffer.is_empty
@@ -91,6 +91,18 @@ class TestTokenBucketRateLimiter:
         fake_clock.advance(1.0)  # Add 10 tokens
         assert limiter.try_acquire(5) is True
 
+    def test_idle_time_while_full_not_credited(self, fake_clock):
+        """Test that time spent with a full bucket does not refill later acquires."""
+        config = RateLimitConfig(rate=10.0, burst=20)
+        limiter = TokenBucketRateLimiter(config, fake_clock)
+
+        fake_clock.advance(100.0)  # Idle with a full bucket
+        assert limiter.try_acquire(20) is True
+
+        fake_clock.advance(0.5)  # Adds 5 tokens
+        assert limiter.try_acquire(6) is False
+        assert limiter.try_acquire(5) is True
+
     def test_reset(self, fake_clock):
         """Test resetting the rate limiter."""
         config = RateLimitConfig(rate=100.0, burst=100)
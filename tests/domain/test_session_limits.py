@@ -1,6 +1,6 @@
 """Tests for SessionLimitChecker."""
 
-from datetime import UTC, datetime, timedelta
+import time
 
 from porterminal.domain import (
     SessionLimitChecker,
@@ -72,7 +72,7 @@ class TestSessionLimitChecker:
     def test_should_cleanup_dead_pty(self, sample_session):
         """Test that session should be cleaned up if PTY is dead."""
         checker = SessionLimitChecker()
-        now = datetime.now(UTC)
+        now = time.monotonic()
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -86,7 +86,7 @@ class TestSessionLimitChecker:
     def test_should_not_cleanup_alive_session(self, sample_session):
         """Test that alive session should not be cleaned up."""
         checker = SessionLimitChecker()
-        now = datetime.now(UTC)
+        now = time.monotonic()
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -102,7 +102,7 @@ class TestSessionLimitChecker:
         checker = SessionLimitChecker(SessionLimitConfig(max_duration_seconds=60))
 
         # Session is 2 minutes old
-        now = sample_session.created_at + timedelta(minutes=2)
+        now = sample_session.created_at + 120
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -119,7 +119,7 @@ class TestSessionLimitChecker:
         sample_session.connected_clients = 0  # Disconnect the session
 
         # Session has been idle for 2 minutes
-        now = sample_session.last_activity + timedelta(minutes=2)
+        now = sample_session.last_activity + 120
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -136,7 +136,7 @@ class TestSessionLimitChecker:
         # sample_session already has connected_clients=1 from fixture
 
         # Session has been "idle" for 2 minutes but is still connected
-        now = sample_session.last_activity + timedelta(minutes=2)
+        now = sample_session.last_activity + 120
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -151,7 +151,7 @@ class TestSessionLimitChecker:
         checker = SessionLimitChecker(SessionLimitConfig(max_duration_seconds=0))
 
         # Session is very old
-        now = sample_session.created_at + timedelta(days=365)
+        now = sample_session.created_at + 365 * 86400
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
@@ -167,7 +167,7 @@ class TestSessionLimitChecker:
         sample_session.connected_clients = 0  # Disconnect the session
 
         # Session has been idle for a very long time
-        now = sample_session.last_activity + timedelta(days=365)
+        now = sample_session.last_activity + 365 * 86400
 
         should_cleanup, reason = checker.should_cleanup_session(
             sample_session,
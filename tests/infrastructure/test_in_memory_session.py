@@ -1,6 +1,6 @@
 """Tests for InMemorySessionRepository."""
 
-from datetime import UTC, datetime
+import time
 
 from porterminal.domain import Session, SessionId, UserId
 from porterminal.infrastructure.repositories import InMemorySessionRepository
@@ -41,7 +41,7 @@ class TestInMemorySessionRepository:
         repo.add(sample_session)
 
         # Add another session for same user
-        now = datetime.now(UTC)
+        now = time.monotonic()
         session2 = Session(
             id=SessionId("session-2"),
             user_id=user_id,
@@ -59,6 +59,30 @@ class TestInMemorySessionRepository:
         assert sample_session in user_sessions
         assert session2 in user_sessions
 
+    def test_mark_used_moves_session_to_end(
+        self, sample_session, user_id, fake_pty, default_dimensions
+    ):
+        """Test get_by_user lists sessions least recently used first."""
+        repo = InMemorySessionRepository()
+        repo.add(sample_session)
+        now = time.monotonic()
+        session2 = Session(
+            id=SessionId("session-2"),
+            user_id=user_id,
+            shell_id="bash",
+            dimensions=default_dimensions,
+            created_at=now,
+            last_activity=now,
+            pty_handle=fake_pty,
+        )
+        repo.add(session2)
+
+        assert repo.get_by_user(user_id) == [sample_session, session2]
+
+        repo.mark_used(sample_session.id)
+
+        assert repo.get_by_user(user_id) == [session2, sample_session]
+
     def test_get_by_user_empty(self, user_id):
         """Test getting sessions for user with no sessions."""
         repo = InMemorySessionRepository()
@@ -94,7 +118,7 @@ class TestInMemorySessionRepository:
         repo.add(sample_session)
         assert repo.count() == 1
 
-        now = datetime.now(UTC)
+        now = time.monotonic()
         session2 = Session(
             id=SessionId("session-2"),
             user_id=user_id,
@@ -117,7 +141,7 @@ class TestInMemorySessionRepository:
         assert repo.count_for_user(user_id) == 1
 
         # Add session for different user
-        now = datetime.now(UTC)
+        now = time.monotonic()
         other_session = Session(
             id=SessionId("other-session"),
             user_id=UserId("other-user"),
@@ -141,7 +165,7 @@ class TestInMemorySessionRepository:
 
         repo.add(sample_session)
 
-        now = datetime.now(UTC)
+        now = time.monotonic()
         session2 = Session(
             id=SessionId("session-2"),
             user_id=UserId("other-user"),
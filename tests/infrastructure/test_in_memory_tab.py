@@ -49,6 +49,25 @@ class TestInMemoryTabRepository:
         retrieved = repo.get(sample_tab.id)
         assert retrieved.name == "Updated Name"
 
+    def test_update_replaces_indexed_tab(self, sample_tab, user_id, session_id):
+        """Test updating with a new Tab object is reflected in index lookups."""
+        repo = InMemoryTabRepository()
+        repo.add(sample_tab)
+
+        replacement = Tab(
+            id=sample_tab.id,
+            user_id=user_id,
+            session_id=session_id,
+            shell_id="bash",
+            name="Replacement",
+            created_at=sample_tab.created_at,
+            last_accessed=sample_tab.last_accessed,
+        )
+        repo.update(replacement)
+
+        assert repo.get_by_user(user_id) == [replacement]
+        assert repo.get_by_session(session_id)[0] is replacement
+
     def test_update_nonexistent_silent(self, sample_tab):
         """Test updating non-existent tab is silent (no error)."""
         repo = InMemoryTabRepository()
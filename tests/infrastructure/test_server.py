@@ -0,0 +1,138 @@
+"""Tests for server and tunnel process watching."""
+
+import gc
+import os
+import signal
+import subprocess
+import sys
+import time
+import warnings
+
+import pytest
+
+from porterminal.infrastructure import server
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix-only test")
+
+
+def spawn(code: str, **kwargs) -> subprocess.Popen:
+    """Start a Python child process running code."""
+    return subprocess.Popen([sys.executable, "-c", code], **kwargs)
+
+
+@pytest.fixture
+def reported(monkeypatch) -> list[str]:
+    """Lines passed to _report_line, stripped."""
+    lines: list[str] = []
+    monkeypatch.setattr(server, "_report_line", lambda line: lines.append(line.strip()))
+    return lines
+
+
+@pytest.fixture
+def processes():
+    """Child processes to kill and reap after the test."""
+    started: list[subprocess.Popen] = []
+    yield started
+    for process in started:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        if process.stdout:
+            process.stdout.close()
+
+
+class TestDrainProcessOutput:
+    """Tests for draining piped process output."""
+
+    async def test_lines_buffered_by_earlier_readline_are_reported(self, reported, processes):
+        """Test that output read ahead into the text stream is not skipped."""
+        chatty = spawn(
+            "import time\n"
+            "print('url', flush=True)\n"
+            "print('error: buffered')\n"
+            "print('error: also buffered', flush=True)\n"
+            "time.sleep(30)",
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        processes.append(chatty)
+        assert chatty.stdout.readline() == "url\n"  # As start_cloudflared() reads it
+        time.sleep(0.2)  # Let the rest land in the stream's buffer
+        quick = spawn("import time; time.sleep(0.3)")
+        processes.append(quick)
+
+        await server.watch_processes([chatty, quick], drain=[chatty])
+
+        assert reported == ["error: buffered", "error: also buffered"]
+
+    async def test_drain_transport_closed_when_watch_ends(self, reported, processes):
+        """Test that cancelled drainers close their pipe transports."""
+        chatty = spawn("import time; time.sleep(30)", stdout=subprocess.PIPE, text=True)
+        quick = spawn("pass")
+        processes.extend([chatty, quick])
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            await server.watch_processes([chatty, quick], drain=[chatty])
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+class TestWatchProcesses:
+    """Tests for waiting on the server and tunnel processes."""
+
+    async def test_first_process_to_exit_is_returned(self, processes):
+        """Test that the process that exits first is returned with its returncode."""
+        slow = spawn("import time; time.sleep(30)")
+        fast = spawn("import sys, time; time.sleep(0.2); sys.exit(3)")
+        processes.extend([slow, fast])
+
+        exited = await server.watch_processes([None, slow, fast])
+
+        assert exited is fast
+        assert exited.returncode == 3
+        assert slow.poll() is None
+
+    async def test_exit_before_handler_installed_is_seen(self, processes):
+        """Test that a child whose SIGCHLD came before the wait started is found."""
+        done = spawn("import sys; sys.exit(5)")
+        slow = spawn("import time; time.sleep(30)")
+        processes.extend([slow, done])
+        # Wait for the exit without reaping it, so SIGCHLD is already spent
+        os.waitid(os.P_PID, done.pid, os.WEXITED | os.WNOWAIT)
+
+        exited = await server._wait_for_any_exit([slow, done])
+
+        assert exited is done
+        assert exited.returncode == 5
+
+    async def test_sigchld_handler_removed_afterwards(self, processes):
+        """Test that the SIGCHLD handler is restored once the wait is over."""
+        before = signal.getsignal(signal.SIGCHLD)
+        quick = spawn("pass")
+        processes.append(quick)
+
+        await server._wait_for_any_exit([quick])
+
+        assert signal.getsignal(signal.SIGCHLD) == before
+
+    async def test_drained_output_reaches_report_line(self, reported, processes):
+        """Test that output of a drained process is passed to _report_line line by line."""
+        chatty = spawn(
+            "import time\n"
+            "print('error: boom')\n"
+            "print('Security warning: check this', flush=True)\n"
+            "time.sleep(30)",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        quick = spawn("import time; time.sleep(0.5)")
+        processes.extend([chatty, quick])
+
+        exited = await server.watch_processes([chatty, quick], drain=[chatty])
+
+        assert exited is quick
+        assert reported == ["error: boom", "Security warning: check this"]
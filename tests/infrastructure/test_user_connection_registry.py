@@ -1,6 +1,9 @@
 """Tests for UserConnectionRegistry."""
 
+import asyncio
+
 from porterminal.domain import UserId
+from porterminal.infrastructure.registry import user_connection_registry
 
 from ..conftest import MockConnection
 
@@ -176,6 +179,26 @@ class TestUserConnectionRegistryBroadcast:
 
         assert count == 2  # 2 successful, 1 failed
 
+    async def test_broadcast_stalled_connection_times_out(
+        self, connection_registry, user_id, monkeypatch
+    ):
+        """Test a connection that never completes a send does not block broadcast."""
+        monkeypatch.setattr(user_connection_registry, "BROADCAST_SEND_TIMEOUT", 0.01)
+        good_conn = MockConnection()
+        stalled_conn = MockConnection()
+
+        async def never_send(msg):
+            await asyncio.Event().wait()
+
+        stalled_conn.send_message = never_send
+
+        await connection_registry.register(user_id, good_conn)
+        await connection_registry.register(user_id, stalled_conn)
+
+        count = await connection_registry.broadcast(user_id, {"type": "test"})
+
+        assert count == 1
+
 
 class TestUserConnectionRegistryEdgeCases:
     """Tests for edge cases and unusual scenarios."""
@@ -0,0 +1,50 @@
+"""Tests for FastAPIWebSocketAdapter."""
+
+import pytest
+
+from porterminal.infrastructure.web import FastAPIWebSocketAdapter
+from porterminal.infrastructure.web.websocket_adapter import CLOSE_MESSAGE_TOO_BIG
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a FastAPI WebSocket."""
+
+    def __init__(self, messages: list[dict]):
+        self._messages = messages
+        self.close_code: int | None = None
+
+    async def receive(self) -> dict:
+        return self._messages.pop(0)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_code = code
+
+
+class TestFastAPIWebSocketAdapterReceive:
+    """Tests for receive()."""
+
+    async def test_receive_parses_text_within_limit(self):
+        """Test that text frames within the limit are parsed as JSON."""
+        ws = FakeWebSocket([{"type": "websocket.receive", "text": '{"type": "ping"}'}])
+        adapter = FastAPIWebSocketAdapter(ws, max_text_size=64)
+
+        assert await adapter.receive() == {"type": "ping"}
+        assert adapter.is_connected()
+
+    async def test_receive_rejects_oversized_text_before_parsing(self):
+        """Test that oversized text frames close the connection unparsed."""
+        ws = FakeWebSocket([{"type": "websocket.receive", "text": "{" * 65}])
+        adapter = FastAPIWebSocketAdapter(ws, max_text_size=64)
+
+        with pytest.raises(ValueError, match="too large"):
+            await adapter.receive()
+
+        assert ws.close_code == CLOSE_MESSAGE_TOO_BIG
+        assert not adapter.is_connected()
+
+    async def test_receive_returns_binary_regardless_of_limit(self):
+        """Test that binary frames are not subject to the text limit."""
+        ws = FakeWebSocket([{"type": "websocket.receive", "bytes": b"x" * 100}])
+        adapter = FastAPIWebSocketAdapter(ws, max_text_size=64)
+
+        assert await adapter.receive() == b"x" * 100
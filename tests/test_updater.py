@@ -1,6 +1,12 @@
 """Tests for updater module."""
 
-from porterminal.updater import _detect_install_method, _is_newer
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from porterminal import updater
+from porterminal.updater import _detect_install_method, _is_newer, _should_check
 
 
 class TestIsNewer:
@@ -85,3 +91,83 @@ class TestDetectInstallMethod:
         """Test fallback to pip for regular installations."""
         monkeypatch.setattr("sys.executable", "/usr/bin/python3")
         assert _detect_install_method() == "pip"
+
+
+class TestShouldCheck:
+    """Tests for _should_check cache freshness."""
+
+    def test_missing_cache_should_check(self, tmp_path, monkeypatch):
+        """Test that a missing cache file triggers a check."""
+        monkeypatch.setattr(updater, "CACHE_FILE", tmp_path / "update_check.json")
+        assert _should_check() is True
+
+    def test_fresh_cache_skips_check(self, tmp_path, monkeypatch):
+        """Test that a recently written cache file skips the check."""
+        cache_file = tmp_path / "update_check.json"
+        cache_file.write_text('{"version": "1.0.0"}')
+        monkeypatch.setattr(updater, "CACHE_FILE", cache_file)
+        monkeypatch.setattr(updater, "_get_check_interval", lambda: 3600)
+        assert _should_check() is False
+
+    def test_stale_cache_should_check(self, tmp_path, monkeypatch):
+        """Test that a cache file older than the interval triggers a check."""
+        cache_file = tmp_path / "update_check.json"
+        cache_file.write_text('{"version": "1.0.0"}')
+        old = time.time() - 7200
+        os.utime(cache_file, (old, old))
+        monkeypatch.setattr(updater, "CACHE_FILE", cache_file)
+        monkeypatch.setattr(updater, "_get_check_interval", lambda: 3600)
+        assert _should_check() is True
+
+
+class TestStartUpdateCheck:
+    """Tests for the background startup update check."""
+
+    def _start(self, monkeypatch, release: threading.Event):
+        """Start the check with a stubbed PyPI lookup that waits for release."""
+        threads: list[threading.Thread] = []
+
+        def make_thread(*args, **kwargs):
+            thread = threading.Thread(*args, **kwargs)
+            threads.append(thread)
+            return thread
+
+        def check_for_updates(use_cache: bool = True):
+            release.wait(2)
+            return True, "9.9.9"
+
+        config = SimpleNamespace(update=SimpleNamespace(notify_on_startup=True))
+        monkeypatch.setattr("porterminal.config.get_config", lambda: config)
+        monkeypatch.setattr(updater, "_should_check", lambda: True)
+        monkeypatch.setattr(updater, "check_for_updates", check_for_updates)
+        monkeypatch.setattr(updater, "get_upgrade_command", lambda: "pip install -U ptn")
+        monkeypatch.setattr(
+            updater, "threading", SimpleNamespace(Thread=make_thread, Lock=threading.Lock)
+        )
+        notify = updater.start_update_check()
+        return notify, threads[0]
+
+    def test_result_before_notify_printed_by_notify(self, monkeypatch, capsys):
+        """Test that a finished check is reported when notify() runs."""
+        release = threading.Event()
+        release.set()
+        notify, thread = self._start(monkeypatch, release)
+        thread.join(2)
+        assert capsys.readouterr().out == ""
+
+        notify()
+
+        assert "Update available" in capsys.readouterr().out
+
+    def test_result_after_notify_printed_by_thread(self, monkeypatch, capsys):
+        """Test that a check finishing after notify() still prints the notice."""
+        release = threading.Event()
+        notify, thread = self._start(monkeypatch, release)
+
+        notify()
+        assert capsys.readouterr().out == ""
+
+        release.set()
+        thread.join(2)
+
+        assert capsys.readouterr().out.count("Update available") == 1